@@ -6,7 +6,7 @@ from alembic import context
 
 # Чтобы модели подхватывались автоматически при их добавлении.
 from pomodoro.auth.models.oauth_accaunts import OAuthAccount  # noqa: F401
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 from pomodoro.database.database import Base
 from pomodoro.task.models.categories import Category  # noqa: F401
 from pomodoro.media.models.files import Files  # noqa: F401
@@ -14,7 +14,7 @@ from pomodoro.task.models.tags import Tag  # noqa: F401
 from pomodoro.task.models.tasks import Task  # noqa: F401
 from pomodoro.user.models.users import UserProfile  # noqa: F401
 
-settings = Settings()
+settings = get_settings()
 # Use synchronous DB URL for Alembic (alembic uses SQLAlchemy sync engine).
 db_path = settings.DB_PATH
 
@@ -8,9 +8,9 @@ fetching from Yandex ID API.
 import requests
 
 from pomodoro.auth.schemas.yandex_user import YandexUserInfo
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 
 class YandexClient:
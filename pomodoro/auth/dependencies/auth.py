@@ -47,7 +47,7 @@ def require_roles(allowed_roles: tuple[UserRole, ...]) -> Callable:
     async def _dep(
         current_user: Annotated[UserProfile, Depends(get_current_user)],
     ):
-        if await require_role(
+        if require_role(
             current_user=current_user, allowed_roles=allowed_roles
         ):
             return current_user
@@ -86,9 +86,9 @@ def require_owner_or_roles(
         current_user: Annotated[UserProfile, Depends(get_current_user)],
         resource: Annotated[Callable, Depends(resource_getter)],
     ):
-        if await require_role(current_user, allowed_roles):
+        if require_role(current_user, allowed_roles):
             return current_user
-        if await require_owner(resource, current_user):
+        if require_owner(resource, current_user):
             return current_user
         raise AccessDenied()
 
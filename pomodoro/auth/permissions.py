@@ -8,10 +8,12 @@ application.
 
 from typing import Any
 
+from sqlalchemy import ColumnElement, true
+
 from pomodoro.user.models.users import UserProfile, UserRole
 
 
-async def require_owner(resource: Any, current_user: UserProfile) -> bool:
+def require_owner(resource: Any, current_user: UserProfile) -> bool:
     """Verify if current user is the owner of the specified resource.
 
     Checks resource ownership by comparing the resource's author
@@ -29,12 +31,10 @@ async def require_owner(resource: Any, current_user: UserProfile) -> bool:
     representing ownership.     Resources without this attribute will
     raise AttributeError.
     """
-    if resource.author_id == current_user.id:
-        return True
-    return False
+    return resource.author_id == current_user.id
 
 
-async def require_role(
+def require_role(
     current_user: UserProfile, allowed_roles: tuple[UserRole, ...]
 ) -> bool:
     """Verify if current user has one of the specified roles.
@@ -53,6 +53,30 @@ async def require_role(
     immutability.     Role checking follows hierarchical permission
     model.
     """
-    if current_user.role in allowed_roles:
-        return True
-    return False
+    return current_user.role in allowed_roles
+
+
+def owner_or_roles_clause(
+    author_column: Any,
+    current_user: UserProfile,
+    allowed_roles: tuple[UserRole, ...],
+) -> ColumnElement[bool]:
+    """Build SQL predicate matching rows the current user may modify.
+
+    SQL counterpart of ``require_role`` and ``require_owner`` combined,
+    so that access can be checked in the ``WHERE`` clause of the
+    modifying statement instead of loading the resource first.
+
+    Args:
+        author_column: Ownership column of the resource model, e.g.
+                       ``Task.author_id``
+        current_user: The authenticated user making the request
+        allowed_roles: Tuple of user roles permitted to modify any row
+
+    Returns:
+        Always-true predicate for allowed roles, ownership predicate
+        otherwise
+    """
+    if require_role(current_user=current_user, allowed_roles=allowed_roles):
+        return true()
+    return author_column == current_user.id
@@ -5,19 +5,21 @@ as well as for creating access tokens (JWT) using Argon2 for password
 hashing and JOSE for JWT operations.
 """
 
+import hashlib
+import hmac
 from datetime import UTC, datetime
 
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from jose import jwt
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 
 # Global password hasher instance with optimized security parameters
 password_hasher = PasswordHasher(
     time_cost=2, memory_cost=19 * 1024, parallelism=1
 )
-settings = Settings()
+settings = get_settings()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -58,6 +60,41 @@ def get_password_hash(password: str) -> str:
     return password_hasher.hash(password=password)
 
 
+def hash_recovery_code(code: int) -> str:
+    """Generate keyed hash of a one-time recovery code.
+
+    Recovery codes are short-lived and single-use, so a keyed HMAC
+    with a server-side secret is used instead of a slow password KDF.
+
+    Args:
+        code: Six-digit numeric recovery code
+
+    Returns:
+        Hex-encoded HMAC-SHA256 digest of the code
+    """
+    return hmac.new(
+        key=settings.RECOVERY_CODE_HMAC_KEY.encode(),
+        msg=f"{code:06d}".encode(),
+        digestmod=hashlib.sha256,
+    ).hexdigest()
+
+
+def verify_recovery_code(code: int, hashed_code: str) -> bool:
+    """Verify recovery code against its stored keyed hash.
+
+    Args:
+        code: Recovery code entered by the user
+        hashed_code: Digest previously produced by hash_recovery_code
+
+    Returns:
+        True if the code matches, False otherwise
+
+    Note:
+        Uses constant-time comparison to prevent timing attacks
+    """
+    return hmac.compare_digest(hash_recovery_code(code), hashed_code)
+
+
 def create_access_token(data: dict) -> str:
     """Generate JWT access token for user authentication.
 
@@ -6,6 +6,8 @@ providers. Handles user verification, token generation, and OAuth
 account linking.
 """
 
+import asyncio
+
 from pomodoro.auth.clients.yandex import YandexClient
 from pomodoro.auth.exceptions.password_incorrect import PasswordVerifyError
 from pomodoro.auth.repositories.auth import AuthRepository
@@ -15,7 +17,7 @@ from pomodoro.auth.security import (
     verify_password,
 )
 from pomodoro.auth.services.mappers import yandex_to_user_and_oauth
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 from pomodoro.user.exceptions.user_not_found import UserNotFoundError
 from pomodoro.user.models.users import UserProfile
 from pomodoro.user.repositories.user import UserRepository
@@ -49,7 +51,7 @@ class AuthService:
         auth_repo: Authentication repository for OAuth account
         management
         """
-        self.settings = Settings()
+        self.settings = get_settings()
         self.client = YandexClient()
         self.user_repo = user_repo
         self.auth_repo = auth_repo
@@ -89,7 +91,8 @@ class AuthService:
         if not user_or_none.is_active:
             raise UserNotFoundError(phone=phone)
 
-        verify = verify_password(
+        verify = await asyncio.to_thread(
+            verify_password,
             plain_password=password,
             hashed_password=user_or_none.hashed_password,
         )
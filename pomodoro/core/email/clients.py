@@ -5,9 +5,9 @@ from email.message import EmailMessage
 import aiosmtplib
 import certifi
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 ssl_context = ssl.create_default_context(cafile=certifi.where())
 
 class SMTPClient:
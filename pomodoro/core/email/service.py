@@ -4,9 +4,9 @@ from email.message import EmailMessage
 
 from pomodoro.core.email.clients import SMTPClient
 from pomodoro.core.email.templates import password_recovery_email
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 
 class EmailService:
@@ -11,6 +11,30 @@ from sqlalchemy.exc import IntegrityError
 
 from pomodoro.core.exceptions.base import AppException
 
+UNIQUE_DETAIL = "Object with this unique value already exists."
+NOT_NULL_DETAIL = "One of the required fields cannot be empty."
+FOREIGN_KEY_DETAIL = (
+    "Reference to non-existent record. "
+    "Please check foreign key relationships."
+)
+DEFAULT_DETAIL = "Database integrity constraint violation."
+
+# PostgreSQL SQLSTATE codes of integrity violations, exposed as
+# ``pgcode`` by both psycopg2 and the SQLAlchemy asyncpg adapter
+SQLSTATE_DETAILS = {
+    "23505": UNIQUE_DETAIL,
+    "23502": NOT_NULL_DETAIL,
+    "23503": FOREIGN_KEY_DETAIL,
+}
+
+# Fallback for drivers without SQLSTATE, checked in order
+MESSAGE_DETAILS = (
+    ("unique constraint", UNIQUE_DETAIL),
+    ("duplicate key value", "Object with this unique key already exists."),
+    ("not-null constraint", NOT_NULL_DETAIL),
+    ("foreign key constraint", FOREIGN_KEY_DETAIL),
+)
+
 
 class IntegrityDBError(AppException):
     """Exception raised for database integrity constraint violations.
@@ -44,18 +68,18 @@ class IntegrityDBError(AppException):
         """
         error_message = str(exc.orig).lower()
 
-        # Determine error type by analyzing original database error message
-        if "unique constraint" in error_message:
-            detail = "Object with this unique value already exists."
-        elif "duplicate key value" in error_message:
-            detail = "Object with this unique key already exists."
-        elif "not-null constraint" in error_message:
-            detail = "One of the required fields cannot be empty."
-        elif "foreign key constraint" in error_message:
-            detail = ("Reference to non-existent record. "
-                      "Please check foreign key relationships.")
-        else:
-            detail = "Database integrity constraint violation."
+        # Determine error type by SQLSTATE with a single dict lookup,
+        # scanning the message only when the driver doesn't provide it
+        detail = SQLSTATE_DETAILS.get(getattr(exc.orig, "pgcode", None))
+        if detail is None:
+            detail = next(
+                (
+                    message_detail
+                    for marker, message_detail in MESSAGE_DETAILS
+                    if marker in error_message
+                ),
+                DEFAULT_DETAIL,
+            )
 
         # Pass human-readable message to base class
         super().__init__(detail=detail)
@@ -6,11 +6,20 @@ foundation for all domain-specific repositories with consistent data
 access patterns.
 """
 
+from collections.abc import AsyncIterator, Iterable
 from datetime import UTC, datetime
-from typing import TypeVar
+from functools import cache
+from typing import Any, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import delete, select
+from sqlalchemy import (
+    Select,
+    bindparam,
+    delete,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from pomodoro.core.exceptions.object_not_found import ObjectNotFoundError
@@ -18,6 +27,47 @@ from pomodoro.core.exceptions.object_not_found import ObjectNotFoundError
 ORMModel = TypeVar("ORMModel")
 
 
+@cache
+def _select_by_id(orm_model: type) -> Select:
+    """Return a reusable ``SELECT ... WHERE id = :object_id`` statement.
+
+    Repositories are created per request, so the statement is cached
+    per model at module level rather than on the instance.
+    """
+    return select(orm_model).where(orm_model.id == bindparam("object_id"))
+
+
+@cache
+def _column_keys(orm_model: type) -> frozenset[str]:
+    """Return the names of the table columns mapped by ``orm_model``."""
+    return frozenset(orm_model.__table__.c.keys())
+
+
+def _column_values(
+    orm_model: type, values: dict[str, Any], skip_none: bool = False
+) -> dict[str, Any]:
+    """Keep only the values that map onto table columns.
+
+    Core ``INSERT``/``UPDATE`` statements reject relationship keys such
+    as ``tags``, which the ORM constructor used to accept silently.
+
+    Args:
+        orm_model: SQLAlchemy model class the statement targets
+        values: Field values dumped from a Pydantic schema
+        skip_none: Drop ``None`` values so column defaults apply, as
+            the ORM does on insert
+
+    Returns:
+        Values restricted to the model's columns
+    """
+    columns = _column_keys(orm_model)
+    return {
+        key: value
+        for key, value in values.items()
+        if key in columns and not (skip_none and value is None)
+    }
+
+
 class CRUDRepository[ORMModel]:
     """Asynchronous CRUD repository with generic type support.
 
@@ -61,15 +111,23 @@ class CRUDRepository[ORMModel]:
             fields
 
         Note:
-            Automatically refreshes the instance to include
-            database-generated values like auto-increment IDs and
-            default field values
+            Database-generated values like auto-increment IDs and
+            default field values come back via ``INSERT ... RETURNING``
+            in the same round trip. Non-column fields and ``None``
+            values are left out of the statement.
         """
+        values = _column_values(
+            self.orm_model, data.model_dump(), skip_none=True
+        )
         async with self.sessionmaker() as session:
             async with session.begin():
-                obj = self.orm_model(**data.model_dump())
-                session.add(obj)
-            await session.refresh(obj)
+                result = await session.execute(
+                    insert(self.orm_model)
+                    .values(**values)
+                    .returning(self.orm_model)
+                    .execution_options(populate_existing=True)
+                )
+                obj = result.scalar_one()
             return obj
 
     async def get_object(self, object_id: int) -> ORMModel | None:
@@ -87,11 +145,8 @@ class CRUDRepository[ORMModel]:
              objects without raising exceptions for non-existent IDs
         """
         async with self.sessionmaker() as session:
-            # External users from suppliers may not have digital ID.
-            pk_attr: str | int = self.orm_model.id
-
             result = await session.execute(
-                select(self.orm_model).where(pk_attr == object_id)
+                _select_by_id(self.orm_model), {"object_id": object_id}
             )
             return result.scalar_one_or_none()
 
@@ -125,8 +180,55 @@ class CRUDRepository[ORMModel]:
             result = await session.execute(select(self.orm_model))
             return list(result.scalars().all())
 
+    async def iter_all_objects(
+        self, chunk_size: int = 1000
+    ) -> AsyncIterator[ORMModel]:
+        """Stream all model instances from the database table.
+
+        Args:
+            chunk_size: Number of rows fetched from the server at once
+
+        Yields:
+            Model instances one by one
+
+        Note:
+            Rows are buffered ``chunk_size`` at a time instead of
+            loading the whole table into memory
+        """
+        async with self.sessionmaker() as session:
+            result = await session.stream(
+                select(self.orm_model).execution_options(
+                    yield_per=chunk_size
+                )
+            )
+            async for obj in result.scalars():
+                yield obj
+
+    async def get_many_objects(
+        self, object_ids: Iterable[int]
+    ) -> list[ORMModel]:
+        """Retrieve model instances by a batch of primary keys.
+
+        Args:
+            object_ids: Primary key identifiers of the target objects
+
+        Returns:
+            List of found model instances, in no particular order
+
+        Note:
+            Uses a single ``WHERE id IN (...)`` query instead of one
+            query per identifier; missing IDs are simply absent
+        """
+        async with self.sessionmaker() as session:
+            result = await session.execute(
+                select(self.orm_model).where(
+                    self.orm_model.id.in_(object_ids)
+                )
+            )
+            return list(result.scalars().all())
+
     async def update_object(
-        self, object_id: int, update_data: BaseModel
+        self, object_id: int, update_data: BaseModel | dict[str, Any]
     ) -> ORMModel | None:
         """Update an existing model instance with partial data.
 
@@ -138,7 +240,8 @@ class CRUDRepository[ORMModel]:
             object_id:
                 Primary key identifier of the object to update
             update_data:
-                Pydantic schema containing fields to modify
+                Pydantic schema containing fields to modify, or
+                values already dumped from one
 
         Returns:
             Updated model instance if found, None if object
@@ -147,29 +250,33 @@ class CRUDRepository[ORMModel]:
         Note:
             Uses exclude_unset=True to only update provided
             fields, enabling partial updates without affecting
-            unspecified fields
+            unspecified fields. Runs as a single
+            ``UPDATE ... RETURNING`` statement; non-column fields are
+            left out of it.
         """
+        values = _column_values(
+            self.orm_model,
+            update_data
+            if isinstance(update_data, dict)
+            else update_data.model_dump(exclude_unset=True),
+        )
         async with self.sessionmaker() as session:
             async with session.begin():
                 # External users from suppliers may not have digital ID.
                 pk_attr: str | int = self.orm_model.id
 
                 result = await session.execute(
-                    select(self.orm_model).where(pk_attr == object_id)
+                    update(self.orm_model)
+                    .where(pk_attr == object_id)
+                    .values(
+                        **values,
+                        # Update modification timestamp manually
+                        updated_at=datetime.now(UTC),
+                    )
+                    .returning(self.orm_model)
+                    .execution_options(populate_existing=True)
                 )
-                obj = result.scalars().one_or_none()
-                if obj is None:
-                    return None
-
-                for key, value in update_data.model_dump(
-                    exclude_unset=True
-                ).items():
-                    setattr(obj, key, value)
-
-                # Update modification timestamp manually
-                obj.updated_at = datetime.now(UTC)
-
-            await session.refresh(obj)
+                obj = result.scalar_one_or_none()
             return obj
 
     async def delete_object(self, object_id: int) -> bool:
@@ -4,6 +4,12 @@ import re
 
 from pomodoro.auth.exceptions.password_incorrect import PasswordVerifyError
 
+# Patterns are compiled once at import time
+LOWERCASE_RE = re.compile(r"[a-z]")
+UPPERCASE_RE = re.compile(r"[A-Z]")
+DIGIT_RE = re.compile(r"\d")
+SPECIAL_RE = re.compile(r"[^\w\s]")
+
 
 class PasswordPolicy:
     """Password complexity validation rules."""
@@ -15,25 +21,25 @@ class PasswordPolicy:
         Raises:
             ValueError: If password does not meet complexity requirements
         """
-        if not re.search(r"[a-z]", value):
+        if not LOWERCASE_RE.search(value):
             raise PasswordVerifyError(
                 detail=("Password must contain at "
                         "least one lowercase letter")
             )
 
-        if not re.search(r"[A-Z]", value):
+        if not UPPERCASE_RE.search(value):
             raise PasswordVerifyError(
                 detail=("Password must contain at "
                  "least one uppercase letter")
             )
 
-        if not re.search(r"\d", value):
+        if not DIGIT_RE.search(value):
             raise PasswordVerifyError(
                 detail=("Password must contain "
                         "at least one digit")
             )
 
-        if not re.search(r"[^\w\s]", value):
+        if not SPECIAL_RE.search(value):
             raise PasswordVerifyError(
                 detail=("Password must contain at "
                         "least one special character")
@@ -2,9 +2,14 @@
 
 CRUD operations.
 """
-from typing import TypeVar
-
-from pydantic import BaseModel
+from collections.abc import Callable, Sequence
+from enum import Enum
+from functools import cache
+from inspect import isclass
+from types import NoneType, UnionType
+from typing import Any, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.exc import IntegrityError
 
 from pomodoro.core.exceptions.integrity import IntegrityDBError
@@ -14,6 +19,74 @@ from pomodoro.core.repositories.base_crud import CRUDRepository
 ResponseSchema = TypeVar("ResponseSchema", bound=BaseModel)
 
 
+@cache
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """Return a reusable list validator for the given response schema."""
+    return TypeAdapter(list[schema])
+
+
+def _field_converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """Return how a raw row value is turned into a field value.
+
+    Enum fields may be stored as plain strings and nested schemas come
+    as ORM objects, so both are converted; other values are used as is.
+    """
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    if get_origin(annotation) is list:
+        item_converter = _field_converter(get_args(annotation)[0])
+        if item_converter is None:
+            return None
+        return lambda items: [item_converter(item) for item in items]
+    if not isclass(annotation):
+        return None
+    if issubclass(annotation, Enum):
+        return annotation
+    if issubclass(annotation, BaseModel):
+        return lambda row: construct_from_row(schema=annotation, row=row)
+    return None
+
+
+@cache
+def _field_converters(
+    schema: type[BaseModel],
+) -> tuple[tuple[str, Callable[[Any], Any] | None], ...]:
+    """Return field names of ``schema`` paired with their converters."""
+    return tuple(
+        (name, _field_converter(field.annotation))
+        for name, field in schema.model_fields.items()
+    )
+
+
+def construct_from_row[Schema: BaseModel](
+    schema: type[Schema], row: object
+) -> Schema:
+    """Build a response schema from a trusted database row.
+
+    Rows come straight from the database and already match the schema
+    types, so validation is skipped via ``model_construct``. Never use
+    this for user-provided data.
+
+    Args:
+        schema: Pydantic response schema to build
+        row: ORM object (or any object exposing the schema fields as
+             attributes)
+
+    Returns:
+        Schema instance built from the row
+    """
+    data = {}
+    for name, converter in _field_converters(schema):
+        value = getattr(row, name)
+        if converter is not None and value is not None:
+            value = converter(value)
+        data[name] = value
+    return schema.model_construct(**data)
+
+
 class CRUDService[ResponseSchema]:
     """Base service class providing CRUD operations.
 
@@ -42,6 +115,36 @@ class CRUDService[ResponseSchema]:
         self.repository = repository
         self.response_schema = response_schema
 
+    def _row_to_response(self, row: object) -> ResponseSchema:
+        """Convert an ORM row into the response schema.
+
+        Subclasses may override this to skip validation for rows whose
+        shape is already guaranteed by the database.
+
+        Args:
+            row: ORM object loaded from the repository
+
+        Returns:
+            Response schema instance built from the row
+        """
+        return self.response_schema.model_validate(obj=row)
+
+    def _rows_to_response(self, rows: Sequence) -> list[ResponseSchema]:
+        """Convert ORM rows into response schemas in one call.
+
+        Validates the whole list in a single pydantic-core pass instead
+        of calling ``_row_to_response`` per row.
+
+        Args:
+            rows: ORM objects loaded from the repository
+
+        Returns:
+            List of response schema instances
+        """
+        return _list_adapter(self.response_schema).validate_python(
+            rows, from_attributes=True
+        )
+
     async def get_one_object(self, object_id: int) -> ResponseSchema:
         """Retrieve a single object by identifier with validation.
 
@@ -62,7 +165,7 @@ class CRUDService[ResponseSchema]:
         db_object = await self.repository.get_one_object_or_raise(
             object_id=object_id
         )
-        return self.response_schema.model_validate(obj=db_object)
+        return self._row_to_response(row=db_object)
 
     async def get_all_objects(self) -> list[ResponseSchema]:
         """Retrieve all objects with schema validation.
@@ -76,10 +179,7 @@ class CRUDService[ResponseSchema]:
             repository
         """
         db_objects = await self.repository.get_all_objects()
-        object_schema = [
-            self.response_schema.model_validate(row) for row in db_objects
-        ]
-        return object_schema
+        return self._rows_to_response(rows=db_objects)
 
     async def create_object(self, object_data: BaseModel) -> ResponseSchema:
         """Create a new object with data validation.
@@ -99,16 +199,17 @@ class CRUDService[ResponseSchema]:
             new_object = await self.repository.create_object(data=object_data)
         except IntegrityError as e:
             raise IntegrityDBError(exc=e) from e
-        return self.response_schema.model_validate(obj=new_object)
+        return self._row_to_response(row=new_object)
 
     async def update_object(
-        self, object_id: int, update_data: BaseModel
+        self, object_id: int, update_data: BaseModel | dict[str, Any]
     ) -> ResponseSchema:
         """Update an existing object with partial data and validation.
 
         Args:
             object_id: Unique identifier of the object to update
-            update_data: Pydantic schema containing update data
+            update_data: Pydantic schema containing update data, or
+                         values already dumped from one
 
         Returns:
             Validated Pydantic response schema of the updated
@@ -128,7 +229,7 @@ class CRUDService[ResponseSchema]:
             raise IntegrityDBError(exc=e) from e
         if updated_object_or_none is None:
             raise ObjectNotFoundError(object_id=object_id)
-        return self.response_schema.model_validate(obj=updated_object_or_none)
+        return self._row_to_response(row=updated_object_or_none)
 
     async def delete_object(self, object_id: int) -> None:
         """Delete an object by identifier with existence validation.
@@ -2,6 +2,7 @@
 
 import os
 from datetime import timedelta
+from functools import cached_property, lru_cache
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
@@ -15,16 +16,20 @@ if DEV:
 elif PROD:
     load_dotenv(".env")
 
+# Bound once, so the class body below reads values straight from the
+# environ mapping instead of going through os.getenv for each one
+_env = os.environ
+
 
 class Settings(BaseSettings):
     """Basic settings of the Pomodoro app."""
 
     # --- Database ---
-    DB_HOST: str = os.getenv("DB_HOST", "localhost")
-    DB_PORT: str = os.getenv("DB_PORT", "5432")
-    DB_NAME: str = os.getenv("DB_NAME", "pomodoro_db")
-    DB_USERNAME: str = os.getenv("DB_USERNAME", "user")
-    DB_PASSWORD: str = os.getenv("DB_PASSWORD", "password")
+    DB_HOST: str = _env.get("DB_HOST", "localhost")
+    DB_PORT: str = _env.get("DB_PORT", "5432")
+    DB_NAME: str = _env.get("DB_NAME", "pomodoro_db")
+    DB_USERNAME: str = _env.get("DB_USERNAME", "user")
+    DB_PASSWORD: str = _env.get("DB_PASSWORD", "password")
     DB_DRIVER: str = "postgresql+psycopg2://"
     ASYNC_DB_DRIVER: str = "postgresql+asyncpg://"
 
@@ -36,17 +41,23 @@ class Settings(BaseSettings):
     )
 
     # --- Cache / Redis ---
-    CACHE_HOST: str = os.getenv("CACHE_HOST", default="localhost")
-    CACHE_PORT: int = int(os.getenv("CACHE_PORT", default=6379))
-    CACHE_DB_NAME: int = int(os.getenv("CACHE_DB_NAME", default=0))
+    CACHE_HOST: str = _env.get("CACHE_HOST", default="localhost")
+    CACHE_PORT: int = int(_env.get("CACHE_PORT", default=6379))
+    CACHE_DB_NAME: int = int(_env.get("CACHE_DB_NAME", default=0))
     CACHE_LIFESPAN: int = 600  # seconds
+    CACHE_MAX_CONNECTIONS: int = int(
+        _env.get("CACHE_MAX_CONNECTIONS", default=64)
+    )
+    # In-process cache of user rows, per worker
+    USER_LOCAL_CACHE_SIZE: int = 10_000
+    USER_LOCAL_CACHE_TTL: int = 10  # seconds
     RECOVERY_PASSWORD_CODE_LIFESPAN: int = 180 # seconds
 
     # --- S3 storage
-    S3_ENDPOINT: str = os.getenv("S3_ENDPOINT", default="http://minio:9000")
-    S3_ACCESS_KEY: str = os.getenv("S3_ACCESS_KEY", default="minio")
-    S3_SECRET_KEY: str = os.getenv("S3_SECRET_KEY", default="password")
-    S3_BUCKET: str = os.getenv("S3_BUCKET", default="pomodoro")
+    S3_ENDPOINT: str = _env.get("S3_ENDPOINT", default="http://minio:9000")
+    S3_ACCESS_KEY: str = _env.get("S3_ACCESS_KEY", default="minio")
+    S3_SECRET_KEY: str = _env.get("S3_SECRET_KEY", default="password")
+    S3_BUCKET: str = _env.get("S3_BUCKET", default="pomodoro")
 
     # --- User validation ---
     MIN_LOGIN_LENGTH: int = 2
@@ -58,12 +69,17 @@ class Settings(BaseSettings):
     MAX_EMAIL_LENGTH: int = 255
 
     # --- JWT ---
-    JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", default="secretkey")
+    JWT_SECRET_KEY: str = _env.get("JWT_SECRET_KEY", default="secretkey")
     JWT_LIFE_SPAN: timedelta = timedelta(weeks=4)
-    JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", default="HS256")
+    JWT_ALGORITHM: str = _env.get("JWT_ALGORITHM", default="HS256")
+
+    # --- Password recovery ---
+    RECOVERY_CODE_HMAC_KEY: str = _env.get(
+        "RECOVERY_CODE_HMAC_KEY", default="recoverykey"
+    )
 
     # --- Password hashing ---
-    CRYPTO_CONTEXT: str = os.getenv("CRYPTO_CONTEXT", default="argon2")
+    CRYPTO_CONTEXT: str = _env.get("CRYPTO_CONTEXT", default="argon2")
 
     # --- Categories ---
     MIN_CATEGORY_NAME_LENGTH: int = 1
@@ -84,26 +100,39 @@ class Settings(BaseSettings):
     THUMB_WIDTH: int = 256
 
     # --- Email ---
-    SMTP_HOST: str = os.getenv("SMTP_HOST", default="smtp.yandex.ru")
+    SMTP_HOST: str = _env.get("SMTP_HOST", default="smtp.yandex.ru")
     SMTP_PORT: int = 465
-    SMTP_USER: str = os.getenv("SMTP_USER", default="email_user")
-    SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", default="password")
+    SMTP_USER: str = _env.get("SMTP_USER", default="email_user")
+    SMTP_PASSWORD: str = _env.get("SMTP_PASSWORD", default="password")
     EMAIL_FROM: str = SMTP_USER
 
     # --- Yandex OAuth ---
-    YANDEX_CLIENT_ID: str = os.getenv(
+    YANDEX_CLIENT_ID: str = _env.get(
         "YANDEX_CLIENT_ID", default="YANDEX_CLIENT_ID"
     )
-    YANDEX_CLIENT_SECRET: str = os.getenv(
+    YANDEX_CLIENT_SECRET: str = _env.get(
         "YANDEX_CLIENT_SECRET", default="YANDEX_CLIENT_SECRET"
     )
     YANDEX_REDIRECT_URI: str = "http://localhost:8000/auth/yandex"
 
-    @property
+    # One instance is shared by every module, so it must not change
+    model_config = {"frozen": True}
+
+    @cached_property
     def get_yandex_redirect_url(self) -> str:
-        """The URL for authorization via Yandex."""
+        """The URL for authorization via Yandex, built once."""
         return (
             f"https://oauth.yandex.ru/authorize?response_type=code"
             f"&client_id={self.YANDEX_CLIENT_ID}"
             f"&redirect_uri={self.YANDEX_REDIRECT_URI}"
         )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the shared application settings instance.
+
+    Settings are built once per process and reused by every module,
+    instead of re-reading the environment on each import.
+    """
+    return Settings()
@@ -0,0 +1,71 @@
+"""In-process TTL cache."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from time import monotonic
+from typing import Any
+
+
+class TTLCache:
+    """Bounded in-memory cache with per-entry expiration.
+
+    Entries expire ``ttl`` seconds after being stored; when ``maxsize``
+    is reached the least recently used entry is evicted. The cache is
+    local to the worker process, so writers must call ``invalidate``
+    and readers in other processes may see stale data for up to
+    ``ttl`` seconds.
+
+    Attributes:
+        maxsize: Maximum number of stored entries
+        ttl: Entry lifetime in seconds
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize empty cache.
+
+        Args:
+            maxsize: Maximum number of stored entries
+            ttl: Entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return cached value or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, None on cache miss
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self._data[key] = (monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop cached value if present.
+
+        Args:
+            key: Cache key
+        """
+        self._data.pop(key, None)
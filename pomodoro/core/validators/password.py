@@ -1,18 +1,20 @@
 """Password validation utilities for Pydantic models."""
 
-from pydantic import field_validator
+from typing import Annotated
+
+from pydantic import AfterValidator
 
 from pomodoro.core.security.password_policy import PasswordPolicy
 
 
-def password_field_validator(field_name: str):
-    """Create reusable password field validator."""
+def _validate_password(value: str) -> str:
+    """Apply password complexity policy to a validated string."""
+    PasswordPolicy.validate(value)
+    return value
 
-    def _validator(cls, value: str | None) -> str | None:
-        if value is None:
-            return value
 
-        PasswordPolicy.validate(value)
-        return value
+# Policy validator built once and attached to the field type itself, so
+# schemas no longer need a per-class ``field_validator``.
+PASSWORD_POLICY = AfterValidator(_validate_password)
 
-    return field_validator(field_name)(_validator)
+PasswordStr = Annotated[str, PASSWORD_POLICY]
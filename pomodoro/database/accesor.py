@@ -11,9 +11,9 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 # Async engine and session factory for SQLAlchemy AsyncIO
 engine: AsyncEngine = create_async_engine(settings.ASYNC_DB_PATH, echo=False)
@@ -8,25 +8,31 @@ from collections.abc import AsyncGenerator
 
 import redis.asyncio as redis
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
+
+# Connection pool shared by every Redis client of the process; waits
+# for a free connection instead of failing when exhausted
+cache_pool = redis.BlockingConnectionPool(
+    host=settings.CACHE_HOST,
+    port=settings.CACHE_PORT,
+    db=settings.CACHE_DB_NAME,
+    decode_responses=True,
+    max_connections=settings.CACHE_MAX_CONNECTIONS,
+)
 
 
 def create_redis_connection() -> redis.Redis:
-    """Create a connection to Redis."""
-    return redis.Redis(
-        host=settings.CACHE_HOST,
-        port=settings.CACHE_PORT,
-        db=settings.CACHE_DB_NAME,
-        decode_responses=True,
-    )
+    """Create a Redis client on top of the shared connection pool."""
+    return redis.Redis(connection_pool=cache_pool)
 
 
 async def get_cache_session() -> AsyncGenerator[redis.Redis, None]:
     """Return the Redis connection and close it correctly in finally.
 
-    The Redis client is created on each call.
+    The Redis client is created on each call, but sockets come from
+    the shared pool, so no connection is opened per request.
     """
     cache_session = create_redis_connection()
     try:
@@ -4,8 +4,9 @@ Routes are explicitly connected, and custom exception handlers are
 registered globally.
 """
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, HTTPException
 from fastapi_limiter import FastAPILimiter
@@ -18,6 +19,7 @@ from pomodoro.core.handlers.exceptions_handlers import (
     http_exception_handler,
 )
 from pomodoro.database.cache.accesor import (
+    cache_pool,
     create_redis_connection,
 )
 from pomodoro.media.handlers.media import router as media_router
@@ -25,6 +27,8 @@ from pomodoro.task.handlers.categories import router as category_router
 from pomodoro.task.handlers.tags import router as tag_router
 from pomodoro.task.handlers.tasks import router as task_router
 from pomodoro.user.handlers.users import router as user_router
+from pomodoro.user.repositories.user import listen_user_invalidations
+from pomodoro.user.schemas.user import build_deferred_schemas
 
 # Logging configuration
 # Logging configuration
@@ -43,7 +47,9 @@ async def lifespan(application: FastAPI):
     """Application lifespan manager for startup and shutdown events.
 
     Handles: - Redis connection initialization for rate limiting -
-    FastAPILimiter setup - Proper resource cleanup during shutdown
+    FastAPILimiter setup - Building deferred schema validators - User
+    cache invalidation listener - Proper resource cleanup during
+    shutdown
 
     Args:     application: FastAPI application instance
     """
@@ -52,13 +58,23 @@ async def lifespan(application: FastAPI):
     await FastAPILimiter.init(redis_connection)
     logging.info("✅ Rate limiter initialized with Redis")
 
+    # Build deferred validators before serving the first request
+    build_deferred_schemas()
+
+    # Keep the in-process user cache in sync with other workers
+    invalidation_listener = asyncio.create_task(listen_user_invalidations())
+
     # Application runs during this yield
     yield
 
     # Clean shutdown procedures
+    invalidation_listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await invalidation_listener
     await FastAPILimiter.close()
     await redis_connection.aclose()
     logging.info("✅ Rate limiter closed")
+    await cache_pool.disconnect()
 
 
 # FastAPI application configuration
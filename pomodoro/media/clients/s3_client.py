@@ -3,9 +3,9 @@
 import aioboto3
 from botocore.config import Config
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 
 async def get_s3_client() -> aioboto3.Session:
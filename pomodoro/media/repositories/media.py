@@ -64,7 +64,8 @@ class MediaRepository(CRUDRepository[Files]):
             object_id=file_id, update_data=update_data
         )
 
-    async def get_all_keys(self) -> list[str]:
+    async def get_all_keys(self) -> set[str]:
         """Get all file storage keys."""
-        files = await super().get_all_objects()
-        return [file.key for file in files]
+        async with self.sessionmaker() as session:
+            result = await session.stream_scalars(select(Files.key))
+            return {key async for key in result}
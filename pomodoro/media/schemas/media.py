@@ -4,14 +4,14 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 from pomodoro.media.models.files import (
     AllowedMimeTypes,
     OwnerType,
     Variants,
 )
 
-settings = Settings()
+settings = get_settings()
 
 
 class CreateFileSchema(BaseModel):
@@ -21,7 +21,7 @@ from pomodoro.core.exceptions.file import (
     InvalidImageFile,
 )
 from pomodoro.core.services.base_crud import CRUDService
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 from pomodoro.media.converters.image_converters import (
     convert_to_webp,
     resize_image,
@@ -38,7 +38,7 @@ from pomodoro.media.schemas.media import CreateFileSchema, ResponseFileSchema
 from pomodoro.media.storage.minio import S3Storage
 from pomodoro.user.models.users import UserProfile
 
-settings = Settings()
+settings = get_settings()
 
 
 class MediaService(CRUDService[ResponseFileSchema]):
@@ -383,11 +383,9 @@ class MediaService(CRUDService[ResponseFileSchema]):
             Number of deleted objects
         """
         deleted = 0
-        all_files = await super().get_all_objects()
-        for schema in all_files:
-            file = schema.model_dump()
-            if not await self.storage.exists(key=file.get("key")):
-                await super().delete_object(object_id=file.get("id"))
+        async for file in self.repository.iter_all_objects():
+            if not await self.storage.exists(key=file.key):
+                await super().delete_object(object_id=file.id)
                 deleted += 1
         return deleted
 
@@ -12,9 +12,9 @@ import aioboto3
 from botocore.exceptions import ClientError
 from fastapi import UploadFile
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 
 class S3Storage:
@@ -12,11 +12,11 @@ from pydantic import ValidationError
 from pomodoro.core.exceptions.file import (
     InvalidCreateFileData,
 )
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 from pomodoro.media.models.files import OwnerType
 from pomodoro.media.schemas.media import CreateFileSchema
 
-settings = Settings()
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
@@ -6,7 +6,7 @@ Route prefixes are configured in `pomodoro.main`.
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from pomodoro.auth.dependencies.auth import require_owner_or_roles
 from pomodoro.task.dependencies.task import get_task_resource, get_task_service
@@ -51,19 +51,24 @@ router = APIRouter()
 )
 async def get_tasks(
     task_service: task_service_annotated,
-) -> list[ResponseTaskSchema]:
+) -> Response:
     """Retrieve all tasks from the system.
 
     Fetches complete list of tasks with caching support for performance.
-    Available to all authenticated users regardless of role.
+    Available to all authenticated users regardless of role. The list
+    is returned as already serialized JSON, bypassing response model
+    encoding; ``response_model`` still documents the schema.
 
     Args:
         task_service: Depends on task service
 
     Returns:
-        List of validated task response schemas
+        JSON response with the list of task response schemas
     """
-    return await task_service.get_all_objects()
+    return Response(
+        content=await task_service.get_all_objects_json(),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -101,23 +106,27 @@ async def create_task(
 @router.patch(
     path="/{task_id}",
     response_model=ResponseTaskSchema,
-    dependencies=[owner_or_admin_depends],
     summary="Update task",
     description=("Modifying an existing task. "
                  "Available to the task owner and administrators.")
 )
 async def update_task(
-    task_id: int, body: UpdateTaskSchema, task_service: task_service_annotated
+    task_id: int,
+    body: UpdateTaskSchema,
+    task_service: task_service_annotated,
+    current_user: current_user_annotated,
 ) -> ResponseTaskSchema:
     """Update an existing task with partial data.
 
     Allows modification of task properties with proper authorization
-    checks. Only task owners and administrators can update tasks.
+    checks. Only task owners and administrators can update tasks; the
+    check is done by the update statement itself.
 
     Args:
         task_id: Unique identifier of the task to update
         body: Partial task data for update operation
         task_service: Depends on task service
+        current_user: Authenticated user performing the update
 
     Returns:
         Updated task with modified fields
@@ -126,8 +135,8 @@ async def update_task(
         ObjectNotFoundError: If task with specified ID doesn't exist
         AccessDenied: If user lacks ownership or administrative privileges
     """
-    return await task_service.update_object(
-        object_id=task_id, update_data=body
+    return await task_service.update_task(
+        object_id=task_id, update_data=body, current_user=current_user
     )
 
 
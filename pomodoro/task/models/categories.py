@@ -10,11 +10,11 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from pomodoro.core.mixins.active_flag import ActiveFlagMixin
 from pomodoro.core.mixins.timestamp import TimestampMixin
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 from pomodoro.database.database import Base
 from pomodoro.user.models.users import UserProfile
 
-settings = Settings()
+settings = get_settings()
 
 
 class Category(TimestampMixin, ActiveFlagMixin, Base):
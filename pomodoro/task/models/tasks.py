@@ -12,7 +12,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from pomodoro.core.mixins.active_flag import ActiveFlagMixin
 from pomodoro.core.mixins.timestamp import TimestampMixin
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 from pomodoro.database.database import Base
 from pomodoro.task.models.categories import Category
 from pomodoro.task.models.task_tags import task_tag_table
@@ -21,7 +21,7 @@ from pomodoro.user.models.users import UserProfile
 if TYPE_CHECKING:
     from pomodoro.task.models.tags import Tag
 
-settings = Settings()
+settings = get_settings()
 
 
 class Task(ActiveFlagMixin, TimestampMixin, Base):
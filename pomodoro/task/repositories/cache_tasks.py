@@ -4,14 +4,24 @@ Provides Redis-based caching layer for task data to improve performance
 and reduce database load for frequently accessed task information.
 """
 
-import json
-
+from pydantic import TypeAdapter
 from redis.asyncio import Redis
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 from pomodoro.task.schemas.task import ResponseTaskSchema
 
-settings = Settings()
+settings = get_settings()
+
+# Validator for the cached task list, built once at import
+task_list_adapter = TypeAdapter(list[ResponseTaskSchema])
+
+# Set of cached task ids; present only while the whole list is cached
+TASKS_INDEX_KEY = "tasks:index"
+
+
+def task_key(task_id: int | str) -> str:
+    """Return cache key of a single task."""
+    return f"task:{task_id}"
 
 
 class TaskCacheRepository:
@@ -19,7 +29,8 @@ class TaskCacheRepository:
 
     Handles caching and retrieval of task data to optimize performance
     and reduce database queries for frequently accessed task
-    information.
+    information. Each task is stored under its own key, so a change to
+    one task only rewrites that task instead of the whole list.
 
     Attributes:     cache_session: Redis client instance for cache
     operations
@@ -34,44 +45,94 @@ class TaskCacheRepository:
         """
         self.cache_session = cache_session
 
-    async def get_all_tasks(
-        self, key: str = "all_tasks"
-    ) -> list[ResponseTaskSchema] | None:
-        """Retrieve all tasks from cache if available.
+    async def get_all_tasks_json(self) -> str | None:
+        """Retrieve all tasks from cache as a raw JSON array.
 
-        Args:     key: Cache key for tasks data (default: "all_tasks")
-
-        Returns:     List of validated task schemas if cache hit, None
+        Returns:     JSON array of tasks ordered by id if cache hit, None
         if cache miss
 
-        Note:     Returns None if data is not found in cache or cache is
-        unavailable
+        Note:     Returns None if the index or any of the indexed tasks
+        is not found in cache. Tasks are stored already serialized, so
+        the array can be sent to the client as is
         """
-        tasks_json = await self.cache_session.get(name=key)
+        # SORT ... GET resolves the index and fetches every task in one
+        # round trip, ordered by id
+        tasks_json = await self.cache_session.sort(
+            TASKS_INDEX_KEY, get=task_key(task_id="*")
+        )
+        if not tasks_json or None in tasks_json:
+            return None
+        return f"[{','.join(tasks_json)}]"
+
+    async def get_all_tasks(self) -> list[ResponseTaskSchema] | None:
+        """Retrieve all tasks from cache if available.
+
+        Returns:     List of validated task schemas ordered by id if
+        cache hit, None if cache miss
+        """
+        tasks_json = await self.get_all_tasks_json()
         if tasks_json is None:
             return None
-        return [
-            ResponseTaskSchema.model_validate(task)
-            for task in json.loads(tasks_json)
-        ]
-
-    async def set_all_tasks(
-        self, tasks: list[ResponseTaskSchema], key: str = "all_tasks"
-    ) -> None:
+        # Validate the whole list in one pydantic-core call
+        return task_list_adapter.validate_json(tasks_json)
+
+    async def set_all_tasks(self, tasks: list[ResponseTaskSchema]) -> None:
         """Store all tasks in cache with configurable expiration.
 
-        Args:     tasks: List of task schemas to cache     key: Cache
-        key for tasks data (default: "all_tasks")
+        Args:     tasks: List of task schemas to cache
 
         Note:     Uses application settings for cache lifespan
-        configuration     Ensures proper JSON serialization with Unicode
-        support
+        configuration     Tasks and the index are written in a single
+        MULTI/EXEC transaction
+        """
+        async with self.cache_session.pipeline(transaction=True) as pipe:
+            pipe.delete(TASKS_INDEX_KEY)
+            for task in tasks:
+                pipe.set(
+                    name=task_key(task.id),
+                    value=task.model_dump_json(),
+                    ex=settings.CACHE_LIFESPAN,
+                )
+            if tasks:
+                pipe.sadd(TASKS_INDEX_KEY, *(task.id for task in tasks))
+                pipe.expire(TASKS_INDEX_KEY, settings.CACHE_LIFESPAN)
+            await pipe.execute()
+
+    async def set_task(self, task: ResponseTaskSchema) -> None:
+        """Store a single task in cache.
+
+        Args:     task: Task schema to cache
         """
-        tasks_json = json.dumps(
-            [task.model_dump() for task in tasks],
-            ensure_ascii=False,
-            default=str,
-        )
         await self.cache_session.set(
-            name=key, value=tasks_json, ex=settings.CACHE_LIFESPAN
+            name=task_key(task.id),
+            value=task.model_dump_json(),
+            ex=settings.CACHE_LIFESPAN,
         )
+
+    async def add_task(self, task: ResponseTaskSchema) -> None:
+        """Store a newly created task in cache.
+
+        The index is dropped rather than extended: it may have expired
+        concurrently, and a recreated index holding only the new task
+        would be served as the full list. The next read rebuilds it.
+
+        Args:     task: Task schema to cache
+        """
+        async with self.cache_session.pipeline(transaction=True) as pipe:
+            pipe.set(
+                name=task_key(task.id),
+                value=task.model_dump_json(),
+                ex=settings.CACHE_LIFESPAN,
+            )
+            pipe.delete(TASKS_INDEX_KEY)
+            await pipe.execute()
+
+    async def delete_task(self, task_id: int) -> None:
+        """Remove a single task from cache and from the index.
+
+        Args:     task_id: Identifier of the deleted task
+        """
+        async with self.cache_session.pipeline(transaction=True) as pipe:
+            pipe.srem(TASKS_INDEX_KEY, task_id)
+            pipe.delete(task_key(task_id))
+            await pipe.execute()
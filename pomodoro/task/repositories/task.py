@@ -5,9 +5,15 @@ repository pattern. Handles database operations for task management with
 proper session management.
 """
 
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, select, update
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from pomodoro.core.exceptions.object_not_found import ObjectNotFoundError
 from pomodoro.core.repositories.base_crud import CRUDRepository
+from pomodoro.task.models.tags import Tag
 from pomodoro.task.models.tasks import Task
 
 
@@ -32,3 +38,56 @@ class TaskRepository(CRUDRepository[Task]):
                           connectivity
         """
         super().__init__(sessionmaker=sessionmaker, orm_model=Task)
+
+    async def update_if_permitted(
+        self,
+        object_id: int,
+        update_data: dict[str, Any],
+        permission_clause: ColumnElement[bool],
+        tag_ids: list[int] | None = None,
+    ) -> Task | None:
+        """Update task only if the permission predicate matches.
+
+        The permission rule is part of the ``WHERE`` clause, so checking
+        access and updating the row is a single ``UPDATE ... RETURNING``
+        statement. Tags are relinked in the same transaction, only once
+        the update has matched.
+
+        Args:
+            object_id: Task identifier to update
+            update_data: Column values to update
+            permission_clause: SQL predicate on Task that the target
+                               row must satisfy
+            tag_ids: New tag identifiers of the task, None to keep the
+                     current tags
+
+        Returns:
+            Updated Task instance, None if task doesn't exist or the
+            predicate didn't match
+
+        Raises:
+            ObjectNotFoundError: If one of the tags doesn't exist; the
+                                 whole update is rolled back
+        """
+        async with self.sessionmaker() as session:
+            async with session.begin():
+                result = await session.execute(
+                    update(Task)
+                    .where(Task.id == object_id, permission_clause)
+                    .values(**update_data, updated_at=datetime.now(UTC))
+                    .returning(Task)
+                    .execution_options(populate_existing=True)
+                )
+                task = result.scalar_one_or_none()
+                if task is not None and tag_ids is not None:
+                    tags = (
+                        await session.scalars(
+                            select(Tag).where(Tag.id.in_(tag_ids))
+                        )
+                    ).all()
+                    found_ids = {tag.id for tag in tags}
+                    for tag_id in tag_ids:
+                        if tag_id not in found_ids:
+                            raise ObjectNotFoundError(object_id=tag_id)
+                    task.tags = list(tags)
+            return task
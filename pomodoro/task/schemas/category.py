@@ -18,9 +18,9 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 
 # ---------------------------------------------------------------------
@@ -10,9 +10,9 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 
 class CreateTagSchema(BaseModel):
@@ -11,10 +11,10 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 from pomodoro.task.schemas.tag import ResponseTagSchema
 
-settings = Settings()
+settings = get_settings()
 
 
 def name_field(default: Any):
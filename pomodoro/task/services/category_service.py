@@ -128,7 +128,8 @@ class CategoryService(CRUDService[ResponseCategorySchema]):
             children_map[category.parent_id].append(category)
 
         def build_node(category) -> CategoryTreeSchema:
-            return CategoryTreeSchema(
+            # Nodes are built from trusted rows, so validation is skipped
+            return CategoryTreeSchema.model_construct(
                 id=category.id,
                 name=category.name,
                 is_active=category.is_active,
@@ -163,7 +164,8 @@ class CategoryService(CRUDService[ResponseCategorySchema]):
                 children_map[category.parent_id].append(category)
 
         def build_node(category) -> CategoryTreeSchema:
-            return CategoryTreeSchema(
+            # Nodes are built from trusted rows, so validation is skipped
+            return CategoryTreeSchema.model_construct(
                 id=category.id,
                 name=category.name,
                 is_active=category.is_active,
@@ -8,7 +8,12 @@ This service acts as the orchestration layer between repositories,
 media services, and API schemas.
 """
 
-from pomodoro.core.services.base_crud import CRUDService
+from collections.abc import Sequence
+
+from pomodoro.core.services.base_crud import (
+    CRUDService,
+    construct_from_row,
+)
 from pomodoro.media.models.files import OwnerType
 from pomodoro.media.services.media_service import MediaService
 from pomodoro.task.repositories.tag import TagRepository
@@ -39,6 +44,23 @@ class TagService(CRUDService[ResponseTagSchema]):
             response_schema=ResponseTagSchema,
         )
 
+    def _rows_to_response(self, rows: Sequence) -> list[ResponseTagSchema]:
+        """Build tag response schemas from trusted rows.
+
+        Rows on the list read path come straight from the database and
+        already match the schema, so validation is skipped.
+
+        Args:
+            rows: Tag ORM objects
+
+        Returns:
+            List of tag response schemas
+        """
+        return [
+            construct_from_row(schema=self.response_schema, row=row)
+            for row in rows
+        ]
+
     # ------------------------------------------------------------------
     # Deletion logic
     # ------------------------------------------------------------------
@@ -5,19 +5,33 @@ integration. Extends base CRUD service with task-specific functionality
 including cache management and media cleanup during operations.
 """
 
+from collections.abc import Sequence
+
 from pydantic import BaseModel
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 # Import dependencies
+from pomodoro.auth.permissions import owner_or_roles_clause
+from pomodoro.core.exceptions.acces_denied import AccessDenied
+from pomodoro.core.exceptions.integrity import IntegrityDBError
 from pomodoro.core.exceptions.object_not_found import ObjectNotFoundError
-from pomodoro.core.services.base_crud import CRUDService
+from pomodoro.core.services.base_crud import (
+    CRUDService,
+    construct_from_row,
+)
 from pomodoro.media.models.files import OwnerType
 from pomodoro.media.services.media_service import MediaService
 from pomodoro.task.models.tags import Tag
-from pomodoro.task.repositories.cache_tasks import TaskCacheRepository
+from pomodoro.task.models.tasks import Task
+from pomodoro.task.repositories.cache_tasks import (
+    TaskCacheRepository,
+    task_list_adapter,
+)
 from pomodoro.task.repositories.task import TaskRepository
 from pomodoro.task.schemas.task import ResponseTaskSchema, UpdateTaskSchema
 from pomodoro.task.services.tag_service import TagService
+from pomodoro.user.models.users import UserProfile, UserRole
 
 
 class TaskService(CRUDService[ResponseTaskSchema]):
@@ -58,6 +72,23 @@ class TaskService(CRUDService[ResponseTaskSchema]):
             repository=task_repo, response_schema=ResponseTaskSchema
         )
 
+    def _rows_to_response(self, rows: Sequence) -> list[ResponseTaskSchema]:
+        """Build task response schemas from trusted rows.
+
+        Rows on the list read path come straight from the database and
+        already match the schema, so validation is skipped.
+
+        Args:
+            rows: Task ORM objects
+
+        Returns:
+            List of task response schemas
+        """
+        return [
+            construct_from_row(schema=self.response_schema, row=row)
+            for row in rows
+        ]
+
     # Tag validation methods
     async def _validate_tags_exist(self, tag_ids: list[int]) -> None:
         """Validate that all provided tag IDs exist.
@@ -68,8 +99,13 @@ class TaskService(CRUDService[ResponseTaskSchema]):
         Raises:
             ObjectNotFoundError: If any tag does not exist
         """
+        tags = await self.tag_service.repository.get_many_objects(
+            object_ids=set(tag_ids)
+        )
+        found_ids = {tag.id for tag in tags}
         for tag_id in tag_ids:
-            await self.tag_service.get_one_object(object_id=tag_id)
+            if tag_id not in found_ids:
+                raise ObjectNotFoundError(object_id=tag_id)
 
     async def _update_task_tags(
         self, task_id: int, tag_ids: list[int]
@@ -127,10 +163,28 @@ class TaskService(CRUDService[ResponseTaskSchema]):
         await self.cache_repo.set_all_tasks(tasks=db_tasks)
         return db_tasks
 
+    async def get_all_objects_json(self) -> str:
+        """Retrieve all tasks as a serialized JSON array.
+
+        Same cache-first strategy as ``get_all_objects``, but on a cache
+        hit the stored JSON is returned as is, skipping validation and
+        re-serialization of every task.
+
+        Returns:
+            JSON array of task response schemas
+        """
+        cache_tasks_json = await self.cache_repo.get_all_tasks_json()
+        if cache_tasks_json is not None:
+            return cache_tasks_json
+
+        db_tasks = await super().get_all_objects()
+        await self.cache_repo.set_all_tasks(tasks=db_tasks)
+        return task_list_adapter.dump_json(db_tasks).decode()
+
     async def create_object(
         self, object_data: BaseModel
     ) -> ResponseTaskSchema:
-        """Create task with author context, tag validation and cache refresh.
+        """Create task with author context, tag validation and caching.
 
         Args:
             object_data: Task creation data including author
@@ -140,71 +194,85 @@ class TaskService(CRUDService[ResponseTaskSchema]):
             Newly created task schema
 
         Note:
-            Automatically validates tag existence and refreshes cache
-            to maintain data consistency
+            Automatically validates tag existence and stores the new
+            task in cache
         """
         # Extract tag_ids and validate if provided
         tag_ids = getattr(object_data, 'tags', None)
         if tag_ids:
             await self._validate_tags_exist(tag_ids)
 
-        # Create task without tags (exclude tags from model creation)
-        task_data_dict = object_data.model_dump(exclude_unset=True)
-        task_data_dict.pop('tags', None)  # Remove tags as it's a relationship
-        task_data = type(object_data)(**task_data_dict)
-
-        new_task = await super().create_object(object_data=task_data)
+        # tags is a relationship; the repository only inserts columns
+        new_task = await super().create_object(object_data=object_data)
 
         # Assign tags if provided
         if tag_ids:
             await self._update_task_tags(new_task.id, tag_ids)
             # Refresh to get updated tags
-            new_task = await self.task_repo.get_object(object_id=new_task.id)
+            new_task = await self.get_one_object(object_id=new_task.id)
 
-        await self._refresh_cache()
+        await self.cache_repo.add_task(task=new_task)
         return new_task
 
-    async def update_object(
+    async def update_task(
         self,
         object_id: int,
         update_data: UpdateTaskSchema,
+        current_user: UserProfile,
     ) -> ResponseTaskSchema:
-        """Update task with tag validation and cache refresh.
+        """Update task on behalf of its owner or an administrator.
+
+        Access is checked in the ``WHERE`` clause of the update itself,
+        so the task isn't loaded beforehand; it's read again only to tell
+        a missing task from a forbidden one when nothing was updated.
 
         Args:
             object_id: Task identifier to update
             update_data: Partial task data for update operation
+            current_user: Authenticated user performing the update
 
         Returns:
             Updated task schema
 
-        Note:
-            Validates tag existence if tag_ids provided and refreshes cache
-            for data consistency
+        Raises:
+            ObjectNotFoundError: If the task or one of the tags doesn't
+                                 exist
+            AccessDenied: If user is neither the task owner nor an
+                          administrator
+            IntegrityDBError: If database constraints are violated
         """
-        # Validate tags exist if provided
-        if update_data.tag_ids is not None:
-            await self._validate_tags_exist(update_data.tag_ids)
-            # Update tags separately
-            await self._update_task_tags(object_id, update_data.tag_ids)
-            # Remove tag_ids from update_data to avoid issues in base update
-            update_data_dict = update_data.model_dump(exclude_unset=True)
-            update_data_dict.pop('tag_ids', None)
-            update_data = UpdateTaskSchema(**update_data_dict)
-
-        updated_task = await super().update_object(
-            object_id=object_id, update_data=update_data
-        )
-        # Refresh cache after modification
-        await self._refresh_cache()
+        values = update_data.model_dump(exclude_unset=True)
+        # tag_ids is a relationship; tags are checked and relinked by
+        # the repository in the same transaction, after access matched
+        tag_ids = values.pop('tag_ids', None)
+
+        try:
+            updated_row = await self.task_repo.update_if_permitted(
+                object_id=object_id,
+                update_data=values,
+                permission_clause=owner_or_roles_clause(
+                    author_column=Task.author_id,
+                    current_user=current_user,
+                    allowed_roles=(UserRole.ROOT, UserRole.ADMIN),
+                ),
+                tag_ids=tag_ids,
+            )
+        except IntegrityError as e:
+            raise IntegrityDBError(exc=e) from e
+        if updated_row is None:
+            await self.task_repo.get_one_object_or_raise(object_id=object_id)
+            raise AccessDenied()
+
+        updated_task = self._row_to_response(row=updated_row)
+        await self.cache_repo.set_task(task=updated_task)
         return updated_task
 
     async def delete_object(self, object_id: int) -> None:
-        """Delete task with media cleanup and cache refresh.
+        """Delete task with media cleanup and cache cleanup.
 
         Performs complete task deletion including: - Removal of
-        associated media files - Database record deletion - Cache
-        refresh for data consistency
+        associated media files - Database record deletion - Removal of
+        the task from cache
 
         Args:
             object_id: Task identifier to delete
@@ -219,18 +287,5 @@ class TaskService(CRUDService[ResponseTaskSchema]):
         )
         # Delete task from database
         await super().delete_object(object_id=object_id)
-        # Refresh cache after deletion
-        await self._refresh_cache()
-
-    # Cache management methods
-    async def _refresh_cache(self):
-        """Private method for cache refresh and synchronization.
-
-        Updates Redis cache with current database state to ensure cache
-        consistency after create, update, or delete operations.
-        """
-        db_tasks = await self.task_repo.get_all_objects()
-        task_schema = [
-            ResponseTaskSchema.model_validate(task) for task in db_tasks
-        ]
-        await self.cache_repo.set_all_tasks(task_schema)
+        # Drop only the deleted task from cache
+        await self.cache_repo.delete_task(task_id=object_id)
@@ -8,13 +8,13 @@ security measures.
 
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import ExpiredSignatureError, JWTError, jwt
 
 from pomodoro.core.dependencies.core import get_email_service
 from pomodoro.core.email.service import EmailService
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 from pomodoro.database.accesor import async_session_maker
 from pomodoro.database.cache.accesor import get_cache_session
 from pomodoro.media.dependencies.media import get_media_service
@@ -24,7 +24,7 @@ from pomodoro.user.repositories.cache_user import UserCacheRepository
 from pomodoro.user.repositories.user import UserRepository
 from pomodoro.user.services.user_service import UserProfileService
 
-settings = Settings()
+settings = get_settings()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
@@ -98,6 +98,7 @@ async def get_user_service(
 
 
 async def get_current_user(
+    request: Request,
     repository: Annotated[UserRepository, Depends(get_user_repository)],
     token: Annotated[str, Depends(oauth2_scheme)],
 ) -> UserProfile:
@@ -109,6 +110,8 @@ async def get_current_user(
     in protected endpoints.
 
     Args:
+        request: Incoming request, used to memoize the resolved user
+                 in ``request.state`` for the rest of the request
         repository: Injected user repository
                     for get user ORM object
         token: JWT token from Authorization header
@@ -125,8 +128,16 @@ async def get_current_user(
 
     Note:
     Implements proper JWT validation with comprehensive error handling
-    for various token-related failure scenarios.
+    for various token-related failure scenarios. The user is resolved at
+    most once per request: subsequent calls from other dependencies
+    (e.g. role checks) reuse the instance stored in ``request.state``.
     """
+    cached_user: UserProfile | None = getattr(
+        request.state, "current_user", None
+    )
+    if cached_user is not None:
+        return cached_user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -150,4 +161,5 @@ async def get_current_user(
     current_user: UserProfile = await (
         repository.get_one_object_or_raise(object_id=user_id)
     )
+    request.state.current_user = current_user
     return current_user
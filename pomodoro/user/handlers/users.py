@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, status
 from fastapi_limiter.depends import RateLimiter
 
 from pomodoro.auth.dependencies.auth import require_roles
+from pomodoro.core.services.base_crud import construct_from_row
 from pomodoro.user.dependencies.user import get_current_user, get_user_service
 from pomodoro.user.models.users import UserProfile, UserRole
 from pomodoro.user.schemas.user import (
@@ -67,7 +68,9 @@ async def get_me(
     current_user: current_user_annotated,
 ) -> ResponseUserProfileSchema:
     """Get information about the user who made the request."""
-    return ResponseUserProfileSchema.model_validate(current_user)
+    return construct_from_row(
+        schema=ResponseUserProfileSchema, row=current_user
+    )
 
 
 @router.patch(
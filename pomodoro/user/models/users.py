@@ -14,11 +14,11 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from pomodoro.auth.models.oauth_accaunts import OAuthAccount  # noqa: F401
 from pomodoro.core.mixins.active_flag import ActiveFlagMixin
 from pomodoro.core.mixins.timestamp import TimestampMixin
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 from pomodoro.core.utils.db_constraints import make_check_in
 from pomodoro.database.database import Base
 
-settings = Settings()
+settings = get_settings()
 
 
 class UserRole(enum.StrEnum):
@@ -5,13 +5,16 @@ control. Defines permission validation rules for user updates and
 administrative operations following hierarchical role permissions.
 """
 
+from sqlalchemy import ColumnElement, or_
+
 from pomodoro.core.exceptions.acces_denied import AccessDenied
 from pomodoro.user.models.users import UserProfile, UserRole
-from pomodoro.user.schemas.user import ResponseUserProfileSchema
 
 
 async def check_update_permissions(
-    target_user: ResponseUserProfileSchema, current_user: UserProfile
+    target_user_id: int,
+    target_role: UserRole | str,
+    current_user: UserProfile,
 ):
     """Check if current user has permission to update target user.
 
@@ -20,8 +23,9 @@ async def check_update_permissions(
     ADMIN users can update themselves but not other ADMINS or ROOT users
     - USER role users can only update themselves
 
-    Args:     target_user: User profile being targeted for update
-    current_user: Authenticated user attempting the update
+    Args:     target_user_id: Identifier of the user being targeted for
+    update     target_role: Role of the targeted user     current_user:
+    Authenticated user attempting the update
 
     Raises:     AccessDenied: If current user lacks permission to update
     target user
@@ -31,15 +35,38 @@ async def check_update_permissions(
     ROOT users     3. Regular users can only update their own profiles
     """
     # 1. ROOT users cannot be modified by anyone except themselves
-    if target_user.role == UserRole.ROOT and current_user.id != target_user.id:
+    if target_role == UserRole.ROOT and current_user.id != target_user_id:
         raise AccessDenied("Root users can only be updated by themselves.")
 
     # 2. ADMIN users can only be updated by themselves or ROOT users
-    if target_user.role == UserRole.ADMIN:
+    if target_role == UserRole.ADMIN:
         if current_user.role not in (UserRole.ROOT, UserRole.ADMIN):
             raise AccessDenied("Insufficient privileges to update admin user.")
         if (
-            current_user.id != target_user.id
+            current_user.id != target_user_id
             and current_user.role != UserRole.ROOT
         ):
             raise AccessDenied("Admin cannot update another admin.")
+
+
+def update_permission_clause(current_user: UserProfile) -> ColumnElement[bool]:
+    """Build SQL predicate matching users the current user may modify.
+
+    Mirrors check_update_permissions so the rules can be applied in the
+    ``WHERE`` clause of the update/delete statement itself: everyone
+    may target themselves and regular users, only ROOT may also target
+    ADMIN users.
+
+    Args:
+        current_user: Authenticated user attempting the operation
+
+    Returns:
+        Boolean SQL expression over UserProfile columns
+    """
+    allowed_roles = [UserRole.USER]
+    if current_user.role == UserRole.ROOT:
+        allowed_roles.append(UserRole.ADMIN)
+    return or_(
+        UserProfile.id == current_user.id,
+        UserProfile.role.in_(allowed_roles),
+    )
@@ -5,9 +5,9 @@ Handles temporary data for password recovery flows using Redis.
 
 from redis.asyncio import Redis
 
-from pomodoro.core.settings import Settings
+from pomodoro.core.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 
 
 class UserCacheRepository:
@@ -108,6 +108,72 @@ class UserCacheRepository:
             f"password_reset:code:{recovery_id}"
         )
 
+    # Recovery session + verification code
+
+    async def set_recovery_bundle(
+        self, recovery_id: str, user_id: int, hashed_recovery_code: str
+    ) -> None:
+        """Store recovery session and hashed code in one round-trip.
+
+        Args:
+            recovery_id: Public recovery session identifier.
+            user_id: Internal user identifier.
+            hashed_recovery_code: Hashed numeric recovery code.
+        """
+        async with self.cache_session.pipeline(transaction=False) as pipe:
+            pipe.set(
+                name=f"password_reset:session:{recovery_id}",
+                value=str(user_id),
+                ex=settings.RECOVERY_PASSWORD_CODE_LIFESPAN,
+            )
+            pipe.set(
+                name=f"password_reset:code:{recovery_id}",
+                value=hashed_recovery_code,
+                ex=settings.RECOVERY_PASSWORD_CODE_LIFESPAN,
+            )
+            await pipe.execute()
+
+    async def get_recovery_bundle(
+        self, recovery_id: str
+    ) -> tuple[str | None, int | None]:
+        """Retrieve hashed recovery code and session user in one round-trip.
+
+        Args:
+            recovery_id: Public recovery session identifier.
+
+        Returns:
+            Tuple of hashed recovery code and user ID, each None if
+            expired.
+        """
+        async with self.cache_session.pipeline(transaction=False) as pipe:
+            pipe.get(name=f"password_reset:code:{recovery_id}")
+            pipe.get(name=f"password_reset:session:{recovery_id}")
+            hashed_code, user_id = await pipe.execute()
+        return hashed_code, int(user_id) if user_id is not None else None
+
+    async def finalize_recovery(
+        self, recovery_id: str, reset_token: str, user_id: int
+    ) -> None:
+        """Destroy recovery session and issue reset token in one step.
+
+        Deletes the recovery code and session and stores the reset
+        token within a single MULTI/EXEC transaction.
+
+        Args:
+            recovery_id: Public recovery session identifier.
+            reset_token: One-time password reset token.
+            user_id: Internal user identifier.
+        """
+        async with self.cache_session.pipeline(transaction=True) as pipe:
+            pipe.delete(f"password_reset:code:{recovery_id}")
+            pipe.delete(f"password_reset:session:{recovery_id}")
+            pipe.set(
+                name=f"password_reset:token:{reset_token}",
+                value=str(user_id),
+                ex=settings.RECOVERY_PASSWORD_CODE_LIFESPAN,
+            )
+            await pipe.execute()
+
     # Password reset token
 
     async def set_recovery_token(
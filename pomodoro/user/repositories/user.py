@@ -5,12 +5,112 @@ Extends base CRUD repository with user-specific operations including
 phone-based lookup and verification status management during updates.
 """
 
+import asyncio
+import logging
+from datetime import UTC, datetime
+from typing import Any
+
 from pydantic import BaseModel
-from sqlalchemy import select
+from redis.exceptions import RedisError
+from sqlalchemy import ColumnElement, delete, select, update
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from pomodoro.core.repositories.base_crud import CRUDRepository
-from pomodoro.user.models.users import UserProfile
+from pomodoro.core.settings import get_settings
+from pomodoro.core.utils.ttl_cache import TTLCache
+from pomodoro.database.cache.accesor import create_redis_connection
+from pomodoro.user.models.users import UserProfile, UserRole
+
+settings = get_settings()
+
+# Hot user lookups (e.g. resolving the current user on every request)
+# are served from memory; every write below invalidates its entry.
+user_cache = TTLCache(
+    maxsize=settings.USER_LOCAL_CACHE_SIZE, ttl=settings.USER_LOCAL_CACHE_TTL
+)
+# Phone -> user id; entries are only trusted while the cached user
+# still has that phone, so they need no invalidation of their own.
+phone_cache = TTLCache(
+    maxsize=settings.USER_LOCAL_CACHE_SIZE, ttl=settings.USER_LOCAL_CACHE_TTL
+)
+# Redis channel used to propagate invalidations to other workers
+USER_INVALIDATION_CHANNEL = "user-invalidate"
+
+logger = logging.getLogger(__name__)
+
+_USER_COLUMNS = tuple(UserProfile.__table__.c)
+
+
+async def invalidate_cached_user(user_id: int) -> None:
+    """Drop user from the local cache and notify other workers.
+
+    Args:
+        user_id: Identifier of the changed or deleted user
+    """
+    user_cache.invalidate(user_id)
+    try:
+        await create_redis_connection().publish(
+            USER_INVALIDATION_CHANNEL, user_id
+        )
+    except RedisError:
+        # The write is already committed; other workers fall back to
+        # TTL expiry instead of failing the request.
+        logger.warning("Failed to publish invalidation of user %s", user_id)
+
+
+def _cache_user(user: UserProfile) -> None:
+    """Store a copy of the user's column values in the local cache.
+
+    Only plain row data is kept, so concurrent requests never share
+    one ORM instance.
+
+    Args:
+        user: User loaded from the database
+    """
+    user_cache.set(
+        user.id,
+        {column.key: getattr(user, column.key) for column in _USER_COLUMNS},
+    )
+
+
+def _get_cached_user(user_id: int) -> UserProfile | None:
+    """Build a fresh user instance from the local cache.
+
+    Args:
+        user_id: User identifier
+
+    Returns:
+        New detached UserProfile instance, None on cache miss
+    """
+    values = user_cache.get(user_id)
+    if values is None:
+        return None
+    return UserProfile(**values)
+
+
+async def listen_user_invalidations() -> None:
+    """Evict users changed by other workers from the local cache.
+
+    Runs for the whole application lifetime; reconnects after any
+    error so a temporary outage only falls back to TTL expiry.
+    """
+    while True:
+        pubsub = create_redis_connection().pubsub()
+        try:
+            await pubsub.subscribe(USER_INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    user_cache.invalidate(int(message["data"]))
+        except RedisError:
+            logger.warning("User invalidation listener lost Redis, retrying")
+            await asyncio.sleep(1)
+        except Exception:
+            # Anything else (e.g. a malformed payload) must not stop
+            # the listener for the rest of the process lifetime.
+            logger.exception("User invalidation listener failed, retrying")
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
 
 
 class UserRepository(CRUDRepository[UserProfile]):
@@ -32,6 +132,35 @@ class UserRepository(CRUDRepository[UserProfile]):
         """
         super().__init__(sessionmaker=sessionmaker, orm_model=UserProfile)
 
+    async def get_object(self, object_id: int) -> UserProfile | None:
+        """Retrieve user by ID, using the in-process cache first.
+
+        Args:
+            object_id: User identifier
+
+        Returns:
+            UserProfile instance if found, None otherwise
+        """
+        user = _get_cached_user(object_id)
+        if user is None:
+            user = await super().get_object(object_id=object_id)
+            if user is not None:
+                _cache_user(user)
+        return user
+
+    async def delete_object(self, object_id: int) -> bool:
+        """Delete user and drop it from the in-process cache.
+
+        Args:
+            object_id: User identifier
+
+        Returns:
+            True if user was deleted, False if user didn't exist
+        """
+        deleted = await super().delete_object(object_id=object_id)
+        await invalidate_cached_user(user_id=object_id)
+        return deleted
+
     async def get_by_phone(self, user_phone: str) -> UserProfile | None:
         """Find user by phone number.
 
@@ -45,12 +174,78 @@ class UserRepository(CRUDRepository[UserProfile]):
         Note:
             - Phone numbers are expected to be in normalized format
               for accurate matching
+            - Repeat lookups are served from the in-process cache
         """
+        user_id = phone_cache.get(user_phone)
+        if user_id is not None:
+            user = _get_cached_user(user_id)
+            if user is not None and user.phone == user_phone:
+                return user
+
         async with self.sessionmaker() as session:
             query = select(UserProfile).where(UserProfile.phone == user_phone)
             result = await session.execute(query)
             user = result.scalar_one_or_none()
-            return user
+        if user is not None:
+            phone_cache.set(user_phone, user.id)
+            _cache_user(user)
+        return user
+
+    async def get_role(self, user_id: int) -> UserRole | None:
+        """Get role of the user.
+
+        Projects a single column instead of loading the whole row.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            User role, None if no user with given ID exists
+        """
+        async with self.sessionmaker() as session:
+            result = await session.execute(
+                select(UserProfile.role).where(UserProfile.id == user_id)
+            )
+            return result.scalar_one_or_none()
+
+    async def has_password(self, user_id: int) -> bool | None:
+        """Check whether the user has a password set.
+
+        Projects a single boolean instead of loading the whole row.
+
+        Args:
+            user_id: User identifier to check
+
+        Returns:
+            True if a password hash is stored, False if not, None if
+            no user with given ID exists
+        """
+        async with self.sessionmaker() as session:
+            result = await session.execute(
+                select(UserProfile.hashed_password.is_not(None)).where(
+                    UserProfile.id == user_id
+                )
+            )
+            return result.scalar_one_or_none()
+
+    @staticmethod
+    def _update_values(update_data: BaseModel) -> dict[str, Any]:
+        """Dump update schema once, resetting changed contact flags.
+
+        Args:
+            update_data: Partial user data for update operation
+
+        Returns:
+            Column values to write
+        """
+        values = update_data.model_dump(exclude_unset=True)
+        # Reset phone verification if phone number is being updated
+        if "phone" in values:
+            values["phone_verified"] = False
+        # Reset email verification if email address is being updated
+        if "email" in values:
+            values["email_verified"] = False
+        return values
 
     async def update_object(self, object_id, update_data: BaseModel):
         """Update user data with verification status management.
@@ -69,12 +264,72 @@ class UserRepository(CRUDRepository[UserProfile]):
         False when email is updated     This ensures security by
         requiring re-verification of changed contact methods
         """
-        # Reset phone verification if phone number is being updated
-        if "phone" in update_data.model_dump(exclude_unset=True):
-            update_data.phone_verified = False
+        values = self._update_values(update_data=update_data)
+        user = await super().update_object(object_id, values)
+        await invalidate_cached_user(user_id=object_id)
+        return user
 
-        # Reset email verification if email address is being updated
-        if "email" in update_data.model_dump(exclude_unset=True):
-            update_data.email_verified = False
+    async def update_if_permitted(
+        self,
+        object_id: int,
+        update_data: BaseModel,
+        permission_clause: ColumnElement[bool],
+    ) -> UserProfile | None:
+        """Update user only if the permission predicate matches.
+
+        The permission rule is part of the ``WHERE`` clause, so checking
+        access and updating the row is a single ``UPDATE ... RETURNING``
+        statement.
+
+        Args:
+            object_id: User identifier to update
+            update_data: Partial user data for update operation
+            permission_clause: SQL predicate on UserProfile that the
+                               target row must satisfy
+
+        Returns:
+            Updated UserProfile instance, None if user doesn't exist
+            or the predicate didn't match
+
+        Note:
+            Resets phone_verified / email_verified the same way as
+            update_object when phone or email is changed
+        """
+        values = self._update_values(update_data=update_data)
+        values["updated_at"] = datetime.now(UTC)
+
+        async with self.sessionmaker() as session:
+            async with session.begin():
+                result = await session.execute(
+                    update(UserProfile)
+                    .where(UserProfile.id == object_id, permission_clause)
+                    .values(**values)
+                    .returning(UserProfile)
+                )
+                user = result.scalar_one_or_none()
+            await invalidate_cached_user(user_id=object_id)
+            return user
+
+    async def delete_if_permitted(
+        self, object_id: int, permission_clause: ColumnElement[bool]
+    ) -> bool:
+        """Delete user only if the permission predicate matches.
 
-        return await super().update_object(object_id, update_data)
+        Args:
+            object_id: User identifier to delete
+            permission_clause: SQL predicate on UserProfile that the
+                               target row must satisfy
+
+        Returns:
+            True if user was deleted, False if user doesn't exist or
+            the predicate didn't match
+        """
+        async with self.sessionmaker() as session:
+            async with session.begin():
+                result = await session.execute(
+                    delete(UserProfile).where(
+                        UserProfile.id == object_id, permission_clause
+                    )
+                )
+            await invalidate_cached_user(user_id=object_id)
+            return result.rowcount > 0  # type: ignore[attr-defined]
@@ -6,34 +6,34 @@ response, and update operations with proper field constraints and
 validation rules for user profile management.
 """
 from datetime import date, datetime
-from typing import Any
+from typing import Annotated
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    StringConstraints,
+    model_validator,
+)
 
 from pomodoro.auth.exceptions.password_incorrect import PasswordVerifyError
-from pomodoro.core.settings import Settings
-from pomodoro.core.validators.password import password_field_validator
+from pomodoro.core.settings import get_settings
+from pomodoro.core.validators.password import PASSWORD_POLICY, PasswordStr
 from pomodoro.user.models.users import UserRole
 
-settings = Settings()
+settings = get_settings()
 
 
-def name_field(default: Any):
-    """Field constraints for user's name length validation.
+# Shared field constraints for user's first, last and middle names.
+# Built once at import time and reused by reference in every schema.
+NAME_FIELD = Field(
+    None,
+    min_length=settings.MIN_USER_NAME_LENGTH,
+    max_length=settings.MAX_USER_NAME_LENGTH,
+    description="User first name, last name or middle name",
+)
 
-    Args:
-        default: Default value for the field
-
-    Returns:
-        Field configuration with length constraints and
-        description
-    """
-    return Field(
-        default,
-        min_length=settings.MIN_USER_NAME_LENGTH,
-        max_length=settings.MAX_USER_NAME_LENGTH,
-        description="User first name, last name or middle name",
-    )
+# Normalized phone number type, e.g. "+79999999999".
+PhoneStr = Annotated[str, StringConstraints(min_length=12, max_length=12)]
 
 
 class BaseUserProfileSchema(BaseModel):
@@ -54,12 +54,10 @@ class BaseUserProfileSchema(BaseModel):
                with length validation
     """
 
-    phone: str | None = Field(
-        None, min_length=12, max_length=12, description="+7 999 999 99 99"
-    )
-    first_name: str | None = name_field(None)
-    last_name: str | None = name_field(None)
-    patronymic: str | None = name_field(None)
+    phone: PhoneStr | None = Field(None, description="+7 999 999 99 99")
+    first_name: str | None = NAME_FIELD
+    last_name: str | None = NAME_FIELD
+    patronymic: str | None = NAME_FIELD
 
     birthday: date | None = None
     email: str | None = Field(None, max_length=settings.MAX_EMAIL_LENGTH)
@@ -82,9 +80,11 @@ class CreateUserProfileSchema(BaseUserProfileSchema):
                   authentication setup
     """
 
-    password: str | None = Field(None, min_length=settings.MIN_PASSWORD_LENGTH)
-
-    _validate_password = password_field_validator("password")
+    password: Annotated[
+        str,
+        StringConstraints(min_length=settings.MIN_PASSWORD_LENGTH),
+        PASSWORD_POLICY,
+    ] | None = None
 
 
 class CreateUserProfileORM(BaseUserProfileSchema):
@@ -101,6 +101,8 @@ class CreateUserProfileORM(BaseUserProfileSchema):
 
     hashed_password: str
 
+    model_config = {"defer_build": True}
+
 
 class ResponseUserProfileSchema(BaseUserProfileSchema):
     """Schema for user response data with complete profile information.
@@ -156,11 +158,7 @@ class SetPasswordSchema(BaseModel):
     Attributes:
         new_password: New user password
     """
-    new_password: str
-
-    _validate_password = password_field_validator(
-        field_name="new_password"
-    )
+    new_password: PasswordStr
 
 
 class ChangePasswordSchema(SetPasswordSchema):
@@ -189,6 +187,8 @@ class UpdatePasswordORMSchema(BaseModel):
     """
     hashed_password: str
 
+    model_config = {"defer_build": True}
+
 
 class ResetPasswordSchema(BaseModel):
     """Schema for reset password.
@@ -198,6 +198,8 @@ class ResetPasswordSchema(BaseModel):
     """
     phone: str
 
+    model_config = {"defer_build": True}
+
 
 class CheckRecoveryCodeSchema(BaseModel):
     """Schema for check recovery password code.
@@ -210,6 +212,8 @@ class CheckRecoveryCodeSchema(BaseModel):
     recovery_id: str
     recovery_code: int
 
+    model_config = {"defer_build": True}
+
 
 class ConfirmResetPasswordSchema(SetPasswordSchema):
     """Schema for confirm reset password via recovery token.
@@ -219,3 +223,21 @@ class ConfirmResetPasswordSchema(SetPasswordSchema):
         new_password: New user password
     """
     token: str
+
+    model_config = {"defer_build": True}
+
+
+def build_deferred_schemas() -> None:
+    """Build validators of schemas declared with ``defer_build``.
+
+    Called once at application startup so that the first request using
+    these schemas doesn't pay for the pydantic-core schema build.
+    """
+    for schema in (
+        CreateUserProfileORM,
+        UpdatePasswordORMSchema,
+        ResetPasswordSchema,
+        CheckRecoveryCodeSchema,
+        ConfirmResetPasswordSchema,
+    ):
+        schema.model_rebuild()
@@ -5,19 +5,38 @@ registration, profile management, and administrative functions. Extends
 base CRUD service with user-specific functionality including password
 hashing, permission checks, and media cleanup.
 """
+import asyncio
 import secrets
 import uuid
+from collections.abc import Sequence
+from typing import NoReturn
+
+from sqlalchemy.exc import IntegrityError
 
 from pomodoro.auth.exceptions.password_incorrect import PasswordVerifyError
-from pomodoro.auth.security import get_password_hash, verify_password
+from pomodoro.auth.security import (
+    get_password_hash,
+    hash_recovery_code,
+    verify_password,
+    verify_recovery_code,
+)
 from pomodoro.core.email.service import EmailService
+from pomodoro.core.exceptions.acces_denied import AccessDenied
 from pomodoro.core.exceptions.conflicts import PasswordAlreadySetError
+from pomodoro.core.exceptions.integrity import IntegrityDBError
 from pomodoro.core.exceptions.invalid_reset_token import InvalidResetToken
-from pomodoro.core.services.base_crud import CRUDService
+from pomodoro.core.exceptions.object_not_found import ObjectNotFoundError
+from pomodoro.core.services.base_crud import (
+    CRUDService,
+    construct_from_row,
+)
 from pomodoro.media.models.files import OwnerType
 from pomodoro.media.services.media_service import MediaService
 from pomodoro.user.models.users import UserProfile, UserRole
-from pomodoro.user.permisiions import check_update_permissions
+from pomodoro.user.permisiions import (
+    check_update_permissions,
+    update_permission_clause,
+)
 from pomodoro.user.repositories.cache_user import UserCacheRepository
 from pomodoro.user.repositories.user import UserRepository
 from pomodoro.user.schemas.user import (
@@ -68,6 +87,33 @@ class UserProfileService(
             repository=user_repo, response_schema=ResponseUserProfileSchema
         )
 
+    def _row_to_response(self, row: UserProfile) -> ResponseUserProfileSchema:
+        """Build response schema from a trusted user row.
+
+        Users are read on every authenticated request and their rows
+        already match the schema, so validation is skipped.
+
+        Args:
+            row: UserProfile ORM object
+
+        Returns:
+            User profile response schema
+        """
+        return construct_from_row(schema=self.response_schema, row=row)
+
+    def _rows_to_response(
+        self, rows: Sequence
+    ) -> list[ResponseUserProfileSchema]:
+        """Build response schemas from trusted user rows.
+
+        Args:
+            rows: UserProfile ORM objects
+
+        Returns:
+            List of user profile response schemas
+        """
+        return [self._row_to_response(row=row) for row in rows]
+
     async def create_user(
         self, user_data: CreateUserProfileSchema
     ) -> ResponseUserProfileSchema:
@@ -87,14 +133,22 @@ class UserProfileService(
         Note:
             - Plain text password is immediately hashed and removed
               from memory for security best practices
+            - ``user_data`` is already validated on API entry, so the
+              ORM schema is built with ``model_construct`` to skip a
+              second validation pass
         """
-        hashed_password = get_password_hash(password=user_data.password)
-        user_dict = user_data.model_dump()
-        user_dict["hashed_password"] = hashed_password
-        del user_dict["password"]
-
-        new_user_data = CreateUserProfileORM(**user_dict)
-        new_user = await super().create_object(object_data=new_user_data)
+        hashed_password = await asyncio.to_thread(
+            get_password_hash, password=user_data.password
+        )
+        # Iterating the model yields already validated native values,
+        # so no serialization pass is needed
+        user_dict = {
+            name: value for name, value in user_data if name != "password"
+        }
+        new_user_data = CreateUserProfileORM.model_construct(
+            **user_dict, hashed_password=hashed_password
+        )
+        new_user = await self.create_object(object_data=new_user_data)
         return new_user
 
     async def update_me(
@@ -112,7 +166,7 @@ class UserProfileService(
         Returns:
             Updated user profile
         """
-        return await super().update_object(
+        return await self.update_object(
             object_id=current_user.id, update_data=update_data
         )
 
@@ -139,16 +193,21 @@ class UserProfileService(
             PermissionError: If current user lacks update
             permissions
         """
-        target_user: ResponseUserProfileSchema = await super().get_one_object(
-            object_id=user_id
-        )
-        # Verify user has permissions to update the target user
-        await check_update_permissions(
-            target_user=target_user, current_user=current_user
-        )
-        return await super().update_object(
-            object_id=user_id, update_data=update_data
-        )
+        # Permission rules are part of the UPDATE predicate, so the
+        # target row is only fetched when the update didn't match.
+        try:
+            updated_user = await self.user_repo.update_if_permitted(
+                object_id=user_id,
+                update_data=update_data,
+                permission_clause=update_permission_clause(current_user),
+            )
+        except IntegrityError as e:
+            raise IntegrityDBError(exc=e) from e
+        if updated_user is None:
+            await self._raise_not_permitted(
+                user_id=user_id, current_user=current_user
+            )
+        return self._row_to_response(row=updated_user)
 
     async def set_password(
             self,
@@ -167,12 +226,12 @@ class UserProfileService(
         Raises:
             PasswordAlreadySetError: If the password is already set.
         """
-        current_user: UserProfile = await (
-            self.repository.get_one_object_or_raise(
-            object_id=current_user_id
-            )
+        has_password = await self.user_repo.has_password(
+            user_id=current_user_id
         )
-        if current_user.hashed_password is not None:
+        if has_password is None:
+            raise ObjectNotFoundError(object_id=current_user_id)
+        if has_password:
             raise PasswordAlreadySetError(
                 detail=("Cannot set password when it is already set. "
                         "You can only change the password.")
@@ -194,20 +253,21 @@ class UserProfileService(
         Raises:
             PasswordVerifyError: If the current password is incorrect.
         """
-        current_user: UserProfile = await (
-            self.repository.get_one_object_or_raise(
-            object_id=current_user_id
-            )
+        # Hash the new password while the user row is being fetched
+        current_user, new_hashed_password = await asyncio.gather(
+            self.repository.get_one_object_or_raise(object_id=current_user_id),
+            asyncio.to_thread(get_password_hash, password=schema.new_password),
         )
-        if not verify_password(
+        if not await asyncio.to_thread(
+            verify_password,
             plain_password=schema.old_password,
-            hashed_password=current_user.hashed_password
+            hashed_password=current_user.hashed_password,
         ):
             raise PasswordVerifyError(
                 detail="Current password is incorrect."
             )
-        return await self._update_user_password(
-            user_id=current_user_id, plain_password=schema.new_password
+        return await self._set_password_hash(
+            user_id=current_user_id, hashed_password=new_hashed_password
         )
 
     async def send_recovery_code_via_email(self, user_phone: str) -> str:
@@ -217,9 +277,9 @@ class UserProfileService(
         verification code, stores its hashed value in cache, and sends the
         code to the user's email address.
 
-        If the user with the given phone number does not exist, a fake
-        recovery session is still created and returned to prevent user
-        enumeration attacks.
+        If the user with the given phone number does not exist, a fresh
+        recovery session identifier is still returned to prevent user
+        enumeration attacks, but no code is generated or stored.
 
         Args:
             user_phone: Phone number provided by the user.
@@ -232,26 +292,24 @@ class UserProfileService(
             - User existence is not disclosed to the client.
             - All sensitive mappings are kept server-side (cache).
         """
+        user = await self.user_repo.get_by_phone(user_phone=user_phone)
         recovery_id = uuid.uuid4().hex
-        recovery_code = secrets.randbelow(900_000) + 100_000
-        hashed_code = get_password_hash(password=str(recovery_code))
 
-        user = await self.user_repo.get_by_phone(user_phone=user_phone)
+        # Unknown phone: return an indistinguishable id, nothing to store
+        if user is None:
+            return recovery_id
 
-        # Always create a recovery session to prevent user enumeration
-        if user is not None:
-            await self.cache_repo.set_recovery_session(
-                recovery_id=recovery_id,
-                user_id=user.id,
-            )
-            await self.cache_repo.set_recovery_password_code(
-                recovery_id=recovery_id,
-                hashed_recovery_code=hashed_code,
-            )
-            await self.email_service.send_password_recovery_email(
-                recipient_email=user.email,
-                recovery_code=recovery_code,
-            )
+        recovery_code = secrets.randbelow(900_000) + 100_000
+        hashed_code = hash_recovery_code(code=recovery_code)
+        await self.cache_repo.set_recovery_bundle(
+            recovery_id=recovery_id,
+            user_id=user.id,
+            hashed_recovery_code=hashed_code,
+        )
+        await self.email_service.send_password_recovery_email(
+            recipient_email=user.email,
+            recovery_code=recovery_code,
+        )
 
         return recovery_id
 
@@ -279,10 +337,7 @@ class UserProfileService(
             - Session is destroyed immediately after successful verification.
             - Reset token has limited TTL and is also single-use.
         """
-        hashed_code = await self.cache_repo.get_recovery_password_code(
-            recovery_id=recovery_id
-        )
-        user_id = await self.cache_repo.get_recovery_session_user(
+        hashed_code, user_id = await self.cache_repo.get_recovery_bundle(
             recovery_id=recovery_id
         )
 
@@ -292,25 +347,16 @@ class UserProfileService(
                 "Please try again."
             )
 
-        if not verify_password(
-                plain_password=str(input_code),
-                hashed_password=hashed_code,
-        ):
+        if not verify_recovery_code(code=input_code, hashed_code=hashed_code):
             raise PasswordVerifyError(
                 detail="Verification code is invalid or expired. "
                 "Please try again."
             )
 
-        # Invalidate recovery session
-        await self.cache_repo.delete_recovery_password_code(
-            recovery_id=recovery_id
-        )
-        await self.cache_repo.delete_recovery_session(
-            recovery_id=recovery_id
-        )
-
+        # Invalidate recovery session and issue reset token atomically
         reset_token = uuid.uuid4().hex
-        await self.cache_repo.set_recovery_token(
+        await self.cache_repo.finalize_recovery(
+            recovery_id=recovery_id,
             reset_token=reset_token,
             user_id=user_id,
         )
@@ -371,18 +417,46 @@ class UserProfileService(
         Raises:
             PermissionError: If current user lacks deletion permissions
         """
-        # Verify user has permissions to delete the target user
-        target_user: ResponseUserProfileSchema = await super().get_one_object(
-            object_id=user_id
-        )
-        await check_update_permissions(
-            target_user=target_user, current_user=current_user
+        deleted = await self.user_repo.delete_if_permitted(
+            object_id=user_id,
+            permission_clause=update_permission_clause(current_user),
         )
+        if not deleted:
+            await self._raise_not_permitted(
+                user_id=user_id, current_user=current_user
+            )
         # Clean up user-associated media files
         await self.media_service.delete_all_by_owner(
             domain=OwnerType.USER, owner_id=user_id
         )
-        return await super().delete_object(object_id=user_id)
+
+    async def _raise_not_permitted(
+        self, user_id: int, current_user: UserProfile
+    ) -> NoReturn:
+        """Explain why a permission-guarded statement matched no rows.
+
+        Only runs on the failure path: loads just the target user's role
+        to report either a missing object or the specific permission
+        violation.
+
+        Args:
+            user_id: Target user identifier
+            current_user: Authenticated user making the request
+
+        Raises:
+            ObjectNotFoundError: If target user doesn't exist
+            AccessDenied: If current user lacks permissions
+        """
+        target_role = await self.user_repo.get_role(user_id=user_id)
+        if target_role is None:
+            raise ObjectNotFoundError(object_id=user_id)
+        await check_update_permissions(
+            target_user_id=user_id,
+            target_role=target_role,
+            current_user=current_user,
+        )
+        # Row changed between the statement and the lookup
+        raise AccessDenied("Insufficient privileges.")
 
     async def _update_user_password(
             self, user_id: int, plain_password: str
@@ -403,8 +477,26 @@ class UserProfileService(
             This method assumes all necessary validation has already been
             performed by the caller.
         """
-        hashed_password = get_password_hash(password=plain_password)
+        hashed_password = await asyncio.to_thread(
+            get_password_hash, password=plain_password
+        )
+        return await self._set_password_hash(
+            user_id=user_id, hashed_password=hashed_password
+        )
+
+    async def _set_password_hash(
+            self, user_id: int, hashed_password: str
+    ) -> ResponseUserProfileSchema:
+        """Persist an already computed password hash.
+
+        Args:
+            user_id: Identifier of the user whose password is updated.
+            hashed_password: Password hash to store.
+
+        Returns:
+            Updated user profile serialized as response schema.
+        """
         update_data = UpdatePasswordORMSchema(hashed_password=hashed_password)
-        return await super().update_object(
+        return await self.update_object(
             object_id=user_id, update_data=update_data
         )
@@ -0,0 +1,91 @@
+"""Shared test fixtures.
+
+Repositories run against an in-memory SQLite database through
+aiosqlite, so the tests need neither PostgreSQL nor Redis.
+"""
+
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+# All models must be imported so that string relationships resolve
+from pomodoro.auth.models.oauth_accaunts import OAuthAccount  # noqa: F401
+from pomodoro.database.database import Base
+from pomodoro.media.models.files import Files  # noqa: F401
+from pomodoro.task.models.categories import Category
+from pomodoro.task.models.tags import Tag  # noqa: F401
+from pomodoro.task.models.tasks import Task  # noqa: F401
+from pomodoro.user.models.users import UserProfile, UserRole
+from pomodoro.user.repositories.user import phone_cache, user_cache
+
+
+@pytest_asyncio.fixture
+async def sessionmaker() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """Session factory bound to a fresh in-memory database."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(
+        bind=engine, expire_on_commit=False, class_=AsyncSession
+    )
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache() -> None:
+    """Start every test with empty in-process user caches."""
+    user_cache._data.clear()
+    phone_cache._data.clear()
+
+
+async def _add(
+    sessionmaker: async_sessionmaker[AsyncSession], obj: object
+) -> object:
+    """Insert a single ORM object and return it."""
+    async with sessionmaker() as session:
+        async with session.begin():
+            session.add(obj)
+    return obj
+
+
+@pytest_asyncio.fixture
+async def user(sessionmaker: async_sessionmaker) -> UserProfile:
+    """Regular user."""
+    return await _add(
+        sessionmaker, UserProfile(phone="+79990000001", role=UserRole.USER)
+    )
+
+
+@pytest_asyncio.fixture
+async def other_user(sessionmaker: async_sessionmaker) -> UserProfile:
+    """Another regular user."""
+    return await _add(
+        sessionmaker, UserProfile(phone="+79990000002", role=UserRole.USER)
+    )
+
+
+@pytest_asyncio.fixture
+async def admin(sessionmaker: async_sessionmaker) -> UserProfile:
+    """Administrator."""
+    return await _add(
+        sessionmaker, UserProfile(phone="+79990000003", role=UserRole.ADMIN)
+    )
+
+
+@pytest_asyncio.fixture
+async def category(
+    sessionmaker: async_sessionmaker, user: UserProfile
+) -> Category:
+    """Category owned by the regular user."""
+    return await _add(sessionmaker, Category(name="Work", author_id=user.id))
@@ -0,0 +1,83 @@
+"""Tests for the base CRUD repository."""
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from pomodoro.task.models.categories import Category
+from pomodoro.task.repositories.tag import TagRepository
+from pomodoro.task.repositories.task import TaskRepository
+from pomodoro.task.schemas.tag import CreateTagORM
+from pomodoro.task.schemas.task import CreateTaskORM
+from pomodoro.user.models.users import UserProfile
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_create_object_skips_relationship_fields(
+    sessionmaker: async_sessionmaker, user: UserProfile, category: Category
+):
+    """Relationship keys such as ``tags`` are not inserted as columns."""
+    repo = TaskRepository(sessionmaker=sessionmaker)
+
+    task = await repo.create_object(
+        data=CreateTaskORM(
+            name="Write tests",
+            pomodoro_count=2,
+            category_id=category.id,
+            tags=[],
+            author_id=user.id,
+        )
+    )
+
+    assert task.id is not None
+    assert task.name == "Write tests"
+    assert task.tags == []
+
+
+async def test_create_object_applies_defaults_for_none(
+    sessionmaker: async_sessionmaker, user: UserProfile
+):
+    """``None`` values fall back to column defaults instead of NULL."""
+    repo = TagRepository(sessionmaker=sessionmaker)
+
+    tag = await repo.create_object(
+        data=CreateTagORM(name="urgent", is_active=None, author_id=user.id)
+    )
+
+    assert tag.is_active is True
+    assert tag.created_at is not None
+
+
+async def test_update_object_skips_non_column_fields(
+    sessionmaker: async_sessionmaker, user: UserProfile, category: Category
+):
+    """Values that are not table columns are left out of the update."""
+    repo = TaskRepository(sessionmaker=sessionmaker)
+    task = await repo.create_object(
+        data=CreateTaskORM(
+            name="Write tests",
+            pomodoro_count=2,
+            category_id=category.id,
+            author_id=user.id,
+        )
+    )
+
+    updated = await repo.update_object(
+        object_id=task.id, update_data={"pomodoro_count": 4, "tag_ids": [1]}
+    )
+
+    assert updated is not None
+    assert updated.pomodoro_count == 4
+
+
+async def test_update_object_returns_none_for_missing_object(
+    sessionmaker: async_sessionmaker,
+):
+    """Updating a missing row returns None."""
+    repo = TaskRepository(sessionmaker=sessionmaker)
+
+    updated = await repo.update_object(
+        object_id=404, update_data={"pomodoro_count": 4}
+    )
+
+    assert updated is None
@@ -0,0 +1,149 @@
+"""Tests for permission-checked task updates."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from pomodoro.auth.permissions import owner_or_roles_clause
+from pomodoro.core.exceptions.object_not_found import ObjectNotFoundError
+from pomodoro.task.models.categories import Category
+from pomodoro.task.models.tasks import Task
+from pomodoro.task.repositories.tag import TagRepository
+from pomodoro.task.repositories.task import TaskRepository
+from pomodoro.task.schemas.tag import CreateTagORM
+from pomodoro.task.schemas.task import CreateTaskORM
+from pomodoro.user.models.users import UserProfile, UserRole
+
+pytestmark = pytest.mark.asyncio
+
+ALLOWED_ROLES = (UserRole.ROOT, UserRole.ADMIN)
+
+
+@pytest.fixture
+def repo(sessionmaker: async_sessionmaker) -> TaskRepository:
+    """Task repository bound to the test database."""
+    return TaskRepository(sessionmaker=sessionmaker)
+
+
+@pytest_asyncio.fixture
+async def task(
+    repo: TaskRepository, user: UserProfile, category: Category
+) -> Task:
+    """Task owned by the regular user."""
+    return await repo.create_object(
+        data=CreateTaskORM(
+            name="Read a book",
+            pomodoro_count=1,
+            category_id=category.id,
+            author_id=user.id,
+        )
+    )
+
+
+async def test_owner_can_update_task(
+    repo: TaskRepository, task: Task, user: UserProfile
+):
+    """The author of a task may update it."""
+    updated = await repo.update_if_permitted(
+        object_id=task.id,
+        update_data={"pomodoro_count": 3},
+        permission_clause=owner_or_roles_clause(
+            Task.author_id, user, ALLOWED_ROLES
+        ),
+    )
+
+    assert updated is not None
+    assert updated.pomodoro_count == 3
+
+
+async def test_admin_can_update_foreign_task(
+    repo: TaskRepository, task: Task, admin: UserProfile
+):
+    """Allowed roles may update tasks they don't own."""
+    updated = await repo.update_if_permitted(
+        object_id=task.id,
+        update_data={"pomodoro_count": 5},
+        permission_clause=owner_or_roles_clause(
+            Task.author_id, admin, ALLOWED_ROLES
+        ),
+    )
+
+    assert updated is not None
+    assert updated.pomodoro_count == 5
+
+
+async def test_other_user_cannot_update_task(
+    repo: TaskRepository, task: Task, other_user: UserProfile
+):
+    """A regular user can't update someone else's task."""
+    updated = await repo.update_if_permitted(
+        object_id=task.id,
+        update_data={"pomodoro_count": 7},
+        permission_clause=owner_or_roles_clause(
+            Task.author_id, other_user, ALLOWED_ROLES
+        ),
+    )
+
+    assert updated is None
+    unchanged = await repo.get_one_object_or_raise(object_id=task.id)
+    assert unchanged.pomodoro_count == 1
+
+
+async def test_other_user_with_missing_tag_is_denied_not_404(
+    repo: TaskRepository, task: Task, other_user: UserProfile
+):
+    """Tags are checked only after access matched."""
+    updated = await repo.update_if_permitted(
+        object_id=task.id,
+        update_data={"pomodoro_count": 7},
+        permission_clause=owner_or_roles_clause(
+            Task.author_id, other_user, ALLOWED_ROLES
+        ),
+        tag_ids=[404],
+    )
+
+    assert updated is None
+
+
+async def test_missing_tag_rolls_back_column_update(
+    repo: TaskRepository, task: Task, user: UserProfile
+):
+    """A failed tag relink leaves the task untouched."""
+    with pytest.raises(ObjectNotFoundError):
+        await repo.update_if_permitted(
+            object_id=task.id,
+            update_data={"pomodoro_count": 7},
+            permission_clause=owner_or_roles_clause(
+                Task.author_id, user, ALLOWED_ROLES
+            ),
+            tag_ids=[404],
+        )
+
+    unchanged = await repo.get_one_object_or_raise(object_id=task.id)
+    assert unchanged.pomodoro_count == 1
+
+
+async def test_owner_relinks_tags_with_update(
+    sessionmaker: async_sessionmaker,
+    repo: TaskRepository,
+    task: Task,
+    user: UserProfile,
+):
+    """Columns and tags are updated together."""
+    tag = await TagRepository(sessionmaker=sessionmaker).create_object(
+        data=CreateTagORM(name="reading", author_id=user.id)
+    )
+
+    updated = await repo.update_if_permitted(
+        object_id=task.id,
+        update_data={"pomodoro_count": 2},
+        permission_clause=owner_or_roles_clause(
+            Task.author_id, user, ALLOWED_ROLES
+        ),
+        tag_ids=[tag.id],
+    )
+
+    assert updated.pomodoro_count == 2
+    assert [t.id for t in updated.tags] == [tag.id]
+    reloaded = await repo.get_one_object_or_raise(object_id=task.id)
+    assert [t.id for t in reloaded.tags] == [tag.id]
@@ -0,0 +1,92 @@
+"""Tests for the in-process user cache and its invalidation."""
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from pomodoro.user.models.users import UserProfile
+from pomodoro.user.repositories import user as user_module
+from pomodoro.user.repositories.user import (
+    USER_INVALIDATION_CHANNEL,
+    UserRepository,
+    invalidate_cached_user,
+    user_cache,
+)
+from pomodoro.user.schemas.user import UpdateUserProfileSchema
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def redis_server(monkeypatch: pytest.MonkeyPatch) -> fakeredis.FakeServer:
+    """Route invalidation messages to an in-memory Redis server."""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        user_module,
+        "create_redis_connection",
+        lambda: fakeredis.FakeAsyncRedis(
+            server=server, decode_responses=True
+        ),
+    )
+    return server
+
+
+async def test_cache_hits_return_separate_instances(
+    sessionmaker: async_sessionmaker, user: UserProfile
+):
+    """Concurrent requests never share one cached ORM instance."""
+    repo = UserRepository(sessionmaker=sessionmaker)
+
+    first = await repo.get_object(object_id=user.id)
+    second = await repo.get_object(object_id=user.id)
+    by_phone = await repo.get_by_phone(user_phone=user.phone)
+
+    assert first is not second
+    assert by_phone is not first
+    assert first.phone == second.phone == by_phone.phone == user.phone
+
+
+async def test_update_invalidates_cached_user(
+    sessionmaker: async_sessionmaker,
+    user: UserProfile,
+    redis_server: fakeredis.FakeServer,
+):
+    """Updating a user evicts it locally and notifies other workers."""
+    repo = UserRepository(sessionmaker=sessionmaker)
+    await repo.get_object(object_id=user.id)
+    listener = fakeredis.FakeAsyncRedis(
+        server=redis_server, decode_responses=True
+    ).pubsub()
+    await listener.subscribe(USER_INVALIDATION_CHANNEL)
+    await listener.get_message(timeout=1)  # subscription confirmation
+
+    await repo.update_object(
+        user.id, UpdateUserProfileSchema(first_name="Ivan")
+    )
+
+    assert user_cache.get(user.id) is None
+    message = await listener.get_message(timeout=1)
+    assert message["data"] == str(user.id)
+    refreshed = await repo.get_object(object_id=user.id)
+    assert refreshed.first_name == "Ivan"
+    await listener.aclose()
+
+
+async def test_invalidation_survives_redis_outage(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """A Redis failure doesn't fail the already committed write."""
+
+    class BrokenRedis:
+        async def publish(self, channel: str, message: int) -> int:
+            raise RedisConnectionError("Redis is down")
+
+    monkeypatch.setattr(
+        user_module, "create_redis_connection", lambda: BrokenRedis()
+    )
+    user_cache.set(1, {"id": 1})
+
+    await invalidate_cached_user(user_id=1)
+
+    assert user_cache.get(1) is None